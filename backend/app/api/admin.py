@@ -1,19 +1,41 @@
+import asyncio
 from fastapi import APIRouter, Depends, HTTPException
 from typing import Dict, Any
 from app.core.dependencies import get_config_service, get_current_admin_user, get_storage_service
 from app.services.config_service import ConfigService
 from app.services.storage_service import StorageService
 from app.models.auth import User
+from app.core.cache import TTLCache
 
 router = APIRouter()
 
+# In-process cache for the admin config view.
+# Invalidated by the config mutation endpoints below; the TTL bounds staleness across workers.
+CONFIG_CACHE_TTL_SECONDS = 300
+_config_cache = TTLCache(maxsize=1, ttl=CONFIG_CACHE_TTL_SECONDS)
+
+
+# Collections that can be cleared through the admin API
+VALID_CACHES: frozenset[str] = frozenset({"news_cache", "historical_data", "optimization_jobs", "optimization_cache", "agent_runs"})
+
+
+def _invalidate_config_cache():
+    _config_cache.pop("all")
+
+
 @router.get("/config")
 async def get_admin_config(
     current_user: User = Depends(get_current_admin_user),
     config_service: ConfigService = Depends(get_config_service)
 ) -> Dict[str, Any]:
     """Get all admin-level configuration"""
-    return await config_service.get_all_config()
+    cached = _config_cache.get("all")
+    if cached is not None:
+        return cached
+
+    config = await config_service.get_all_config()
+    _config_cache.set("all", config)
+    return config
 
 @router.put("/config/etfs")
 async def update_etf_config(
@@ -23,6 +45,7 @@ async def update_etf_config(
 ):
     """Update ETF configuration"""
     await config_service.update_etf_config(new_config)
+    _invalidate_config_cache()
     return {"status": "updated", "config_type": "etfs"}
 
 @router.put("/config/forecasting")
@@ -33,6 +56,7 @@ async def update_forecasting_config(
 ):
     """Update forecasting configuration"""
     await config_service.update_forecasting_config(new_config)
+    _invalidate_config_cache()
     return {"status": "updated", "config_type": "forecasting"}
 
 @router.post("/config/reset")
@@ -42,6 +66,7 @@ async def reset_config_to_defaults(
 ):
     """Reset all configuration to YAML defaults"""
     await config_service.reset_to_defaults()
+    _invalidate_config_cache()
     return {"status": "reset", "message": "Configuration reset to YAML defaults"}
 
 @router.get("/cache/stats")
@@ -55,17 +80,22 @@ async def get_cache_stats(
     
     collections = ["news_cache", "historical_data", "optimization_jobs", "agent_runs", "plans"]
     
-    for collection in collections:
-        try:
-            items = await storage_service.list_all(collection)
+    # Count all collections concurrently without loading documents; failures are reported per collection
+    results = await asyncio.gather(
+        *(storage_service.count(collection) for collection in collections),
+        return_exceptions=True
+    )
+    
+    for collection, count in zip(collections, results):
+        if isinstance(count, Exception):
             stats[collection] = {
-                "count": len(items),
-                "collection": collection
+                "count": 0,
+                "error": str(count)
             }
-        except Exception as e:
+        else:
             stats[collection] = {
-                "count": 0,
-                "error": str(e)
+                "count": count,
+                "collection": collection
             }
     
     return stats
@@ -77,21 +107,19 @@ async def clear_cache(
     storage_service: StorageService = Depends(get_storage_service)
 ):
     """Clear specific cache type"""
-    valid_caches = ["news_cache", "historical_data", "optimization_jobs", "agent_runs"]
-    
-    if cache_type not in valid_caches:
-        raise HTTPException(status_code=400, detail=f"Invalid cache type. Must be one of: {valid_caches}")
+    if cache_type not in VALID_CACHES:
+        raise HTTPException(status_code=400, detail=f"Invalid cache type. Must be one of: {sorted(VALID_CACHES)}")
     
-    # Get all items and delete them
+    # Collect the ids of all items (without holding the documents) and delete them in bulk
     try:
-        items = await storage_service.list_all(cache_type)
-        count = 0
-        for item in items:
-            # Extract ID from item - could be under different keys
-            item_id = item.get("id") or item.get("job_id") or item.get("run_id") or item.get("plan_id")
-            if item_id:
-                await storage_service.delete(cache_type, item_id)
-                count += 1
+        # Extract ID from item - could be under different keys
+        id_fields = ["id", "job_id", "run_id", "plan_id"]
+        item_ids = [
+            item_id async for item in storage_service.stream(cache_type, fields=id_fields)
+            if (item_id := item.get("id") or item.get("job_id") or item.get("run_id") or item.get("plan_id"))
+        ]
+        await storage_service.delete_many(cache_type, item_ids)
+        count = len(item_ids)
         
         return {"status": "cleared", "cache_type": cache_type, "items_deleted": count}
     except Exception as e:
@@ -1,4 +1,8 @@
+import asyncio
+import os
+import orjson
 from fastapi import APIRouter, Depends, HTTPException, BackgroundTasks
+from fastapi.responses import StreamingResponse
 from typing import Dict, Any, List, Optional
 from pydantic import BaseModel
 from app.services.agent_service import AgentService
@@ -8,6 +12,15 @@ from app.models.auth import User
 
 router = APIRouter()
 
+# Caps how many agent runs execute at once; queued runs wait for a free slot
+_agent_semaphore = asyncio.Semaphore(int(os.getenv("AGENT_CONCURRENCY", "4")))
+
+
+async def _execute_run_bounded(agent_service: AgentService, run_id: str, agent_name: str, input_data: Any):
+    async with _agent_semaphore:
+        await agent_service.execute_run(run_id=run_id, agent_name=agent_name, input_data=input_data)
+
+
 class AgentRunRequest(BaseModel):
     input: Any
 
@@ -28,7 +41,8 @@ async def run_agent(
         run_id = await agent_service.create_run(agent_name, request.input)
         
         background_tasks.add_task(
-            agent_service.execute_run, 
+            _execute_run_bounded,
+            agent_service,
             run_id=run_id, 
             agent_name=agent_name, 
             input_data=request.input
@@ -52,6 +66,28 @@ async def get_run_status(
         raise HTTPException(status_code=404, detail="Run not found")
     return run
 
+@router.get("/runs/{run_id}/stream")
+async def stream_run(
+    run_id: str,
+    current_user: User = Depends(get_current_user),
+    agent_service: AgentService = Depends(get_agent_service)
+):
+    """
+    Server-Sent Events stream of a run: the current run record first,
+    then status and log events until the run completes or fails.
+    """
+    run = await agent_service.get_run(run_id)
+    if not run:
+        raise HTTPException(status_code=404, detail="Run not found")
+
+    async def event_stream():
+        async for event in agent_service.stream_run(run_id):
+            # orjson encodes straight to bytes; numpy values and non-str keys come from agent state
+            data = orjson.dumps(event, default=str, option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS)
+            yield b"data: " + data + b"\n\n"
+
+    return StreamingResponse(event_stream(), media_type="text/event-stream")
+
 @router.get("/runs/{run_id}/logs")
 async def get_run_logs(
     run_id: str,
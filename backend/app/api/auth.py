@@ -4,8 +4,9 @@ from pydantic import BaseModel
 from typing import Tuple
 import re
 
-from app.services.auth_service import AuthService
-from app.core.dependencies import get_auth_service, get_current_user
+from app.services.auth_service import AuthService, oauth2_scheme
+from app.core.dependencies import get_auth_service, get_current_user, invalidate_current_user
+from app.core.concurrency import run_limited, password_hash_limiter
 from app.models.auth import Token, User, UserInDB
 
 router = APIRouter()
@@ -13,15 +14,17 @@ router = APIRouter()
 # Password strength requirements
 MIN_PASSWORD_LENGTH = 8
 # Requires at least one letter and one digit (minimum)
+_HAS_LETTER = re.compile(r"[A-Za-z]").search
+_HAS_DIGIT = re.compile(r"\d").search
 
 
 def validate_password_strength(password: str) -> Tuple[bool, str]:
     """Validate password strength. Returns (is_valid, error_message)."""
     if len(password) < MIN_PASSWORD_LENGTH:
         return False, f"Password must be at least {MIN_PASSWORD_LENGTH} characters long"
-    if not re.search(r"[A-Za-z]", password):
+    if not _HAS_LETTER(password):
         return False, "Password must contain at least one letter"
-    if not re.search(r"\d", password):
+    if not _HAS_DIGIT(password):
         return False, "Password must contain at least one digit"
     return True, ""
 
@@ -42,8 +45,9 @@ async def login_for_access_token(
     access_token = auth_service.create_access_token(
         data={"sub": user.username, "role": user.role}
     )
+    # Role is embedded so /refresh can mint access tokens without a user lookup
     refresh_token = auth_service.create_refresh_token(
-        data={"sub": user.username}
+        data={"sub": user.username, "role": user.role}
     )
     
     # Set HttpOnly, Secure cookie for refresh token
@@ -85,25 +89,22 @@ async def refresh_token(
             raise credentials_exception
             
         username = payload.get("sub")
-        # Validate user still exists - optional but recommended
-        # user = await auth_service.user_provider.get_user_by_username(username)
-        # if not user: raise credentials_exception
-        
-        # Here we might want to preserve the role if we don't fetch the user, 
-        # but access token needs a role. 
-        # Ideally we fetch the user to get the role.
-        # Since we have access to user_provider via auth_service, let's do it if possible.
-        # But for now, let's look up the user again.
-        
-        user = await auth_service.user_provider.get_user_by_username(username)
+        if username is None:
+            raise credentials_exception
+
+        # The role comes from the stored user, not the old token, so deleted users
+        # cannot keep rotating tokens and role changes apply on the next refresh.
+        # Lookups are cached briefly so refresh storms share one read.
+        user = await auth_service.get_user(username)
         if not user:
             raise credentials_exception
+        role = user.role
             
         new_access_token = auth_service.create_access_token(
-            data={"sub": username, "role": user.role}
+            data={"sub": username, "role": role}
         )
         new_refresh_token = auth_service.create_refresh_token(
-            data={"sub": username}
+            data={"sub": username, "role": role}
         )
         
         # Rotate refresh token
@@ -125,7 +126,8 @@ async def logout(
     response: Response,
     refresh_token: str | None = Cookie(default=None),
     auth_service: AuthService = Depends(get_auth_service),
-    current_user: User = Depends(get_current_user)
+    current_user: User = Depends(get_current_user),
+    access_token: str = Depends(oauth2_scheme)
 ):
     """
     Logout user by revoking the refresh token.
@@ -133,6 +135,7 @@ async def logout(
     """
     if refresh_token:
         await auth_service.revoke_token(refresh_token)
+    invalidate_current_user(access_token)
     
     response.delete_cookie("refresh_token")
     return {"message": "Successfully logged out"}
@@ -168,16 +171,8 @@ async def register(
             detail=error_msg
         )
 
-    # Check if user already exists
-    existing_user = await auth_service.user_provider.get_user_by_username(request.username)
-    if existing_user:
-        raise HTTPException(
-            status_code=status.HTTP_409_CONFLICT,
-            detail="Username already exists"
-        )
-
-    # Hash password and create user
-    hashed_password = auth_service.get_password_hash(request.password)
+    # Hash password (bcrypt is CPU-bound, keep it off the event loop)
+    hashed_password = await run_limited(password_hash_limiter, auth_service.get_password_hash, request.password)
     user_in_db = UserInDB(
         username=request.username,
         hashed_password=hashed_password,
@@ -185,6 +180,13 @@ async def register(
         disabled=False
     )
 
-    created_user = await auth_service.user_provider.create_user(user_in_db)
+    # Existence check and insert in one write
+    created_user = await auth_service.user_provider.create_user_if_absent(user_in_db)
+    if created_user is None:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail="Username already exists"
+        )
+    auth_service.invalidate_user(request.username)
 
     return created_user
@@ -1,11 +1,14 @@
-from fastapi import APIRouter, Depends, HTTPException
+import hashlib
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
 from typing import List, Optional, Dict, Any
-from pydantic import BaseModel
+from pydantic import BaseModel, TypeAdapter
 
 from app.services.plan_service import PlanService
 from app.services.research_agent import ResearchAgent
-from app.models.plan import Plan
+from app.models.plan import Plan, PlanSummaryPage, ResearchRun
 from app.models.types import RiskProfile
+from app.core.cache import TTLCache
+from app.core.http_cache import etag_matches
 from app.core.dependencies import get_plan_service, get_logger, get_research_agent, get_current_user
 from app.services.logger_service import LoggerService
 from app.models.auth import User
@@ -42,6 +45,41 @@ class ResearchRequest(BaseModel):
     query: str
 
 
+# Research context per plan version; any change to a plan bumps updated_at, so entries never go stale
+_plan_context_cache = TTLCache(maxsize=256, ttl=3600)
+
+
+def _get_plan_context(plan: Plan) -> Dict[str, Any]:
+    """Research agent context for a plan. Shared between requests, so treat it as read-only."""
+    key = (plan.plan_id, plan.updated_at)
+    plan_context = _plan_context_cache.get(key)
+    if plan_context is None:
+        plan_context = {
+            "plan_name": plan.name,
+            "risk_preference": plan.risk_preference,
+            "optimization_result": plan.optimization_result.model_dump() if plan.optimization_result else None,
+            "initial_amount": plan.initial_amount
+        }
+        _plan_context_cache.set(key, plan_context)
+    return plan_context
+
+
+# Plans are already validated when loaded; serialize them straight to JSON bytes
+# instead of letting FastAPI re-validate and re-dump them through response_model.
+# The output keeps null fields, so it matches the declared response_model schema.
+_plan_list_adapter = TypeAdapter(List[Plan])
+
+
+def _plans_response(content: bytes, etag: str) -> Response:
+    return Response(content=content, media_type="application/json", headers={"ETag": etag})
+
+
+def _plans_etag(plans: List[Plan]) -> str:
+    """ETag derived from plan ids and update times; any change to a plan bumps updated_at."""
+    versions = ",".join(f"{plan.plan_id}:{plan.updated_at.isoformat()}" for plan in plans)
+    return f'"{hashlib.md5(versions.encode()).hexdigest()}"'
+
+
 @router.post("/plans", response_model=Dict[str, str])
 async def create_plan(
     request: PlanCreateRequest,
@@ -75,6 +113,7 @@ async def create_plan(
 
 @router.get("/plans", response_model=List[Plan])
 async def list_plans(
+    request: Request,
     user_id: str = "default",
     current_user: User = Depends(get_current_user),
     plan_service: PlanService = Depends(get_plan_service),
@@ -84,29 +123,63 @@ async def list_plans(
     List all plans for a user.
 
     Returns plans sorted by updated_at descending (most recent first).
+    Honors If-None-Match with a 304 when no plan changed.
     """
     try:
         plans = await plan_service.list_plans(user_id)
-        return plans
+        etag = _plans_etag(plans)
+        if etag_matches(request, etag):
+            return Response(status_code=304, headers={"ETag": etag})
+        return _plans_response(_plan_list_adapter.dump_json(plans), etag)
     except Exception as e:
         logger.error(f"Error listing plans: {e}")
         raise HTTPException(status_code=500, detail=str(e))
 
 
+@router.get("/plans/summaries", response_model=PlanSummaryPage)
+async def list_plan_summaries(
+    user_id: str = "default",
+    limit: int = Query(50, ge=1, le=200, description="Maximum number of plans per page"),
+    cursor: Optional[str] = Query(None, description="next_cursor from the previous page"),
+    current_user: User = Depends(get_current_user),
+    plan_service: PlanService = Depends(get_plan_service),
+    logger: LoggerService = Depends(get_logger)
+):
+    """
+    List plans for a user as lightweight summaries, one page at a time.
+
+    Only summary fields are read from storage, so this stays cheap for users with
+    many plans. Pass `next_cursor` back as `cursor` to fetch the following page.
+    """
+    try:
+        items, next_cursor = await plan_service.list_plan_summaries(user_id, limit, cursor)
+        return PlanSummaryPage(items=items, next_cursor=next_cursor)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=f"Invalid cursor: {e}")
+    except Exception as e:
+        logger.error(f"Error listing plan summaries: {e}")
+        raise HTTPException(status_code=500, detail=str(e))
+
+
 @router.get("/plans/{plan_id}", response_model=Plan)
 async def get_plan(
     plan_id: str,
+    request: Request,
     current_user: User = Depends(get_current_user),
     plan_service: PlanService = Depends(get_plan_service),
     logger: LoggerService = Depends(get_logger)
 ):
     """
     Get a specific plan by ID.
+    Honors If-None-Match with a 304 when the plan did not change.
     """
     plan = await plan_service.get_plan(plan_id)
     if not plan:
         raise HTTPException(status_code=404, detail="Plan not found")
-    return plan
+    etag = _plans_etag([plan])
+    if etag_matches(request, etag):
+        return Response(status_code=304, headers={"ETag": etag})
+    return _plans_response(plan.model_dump_json().encode(), etag)
 
 
 @router.put("/plans/{plan_id}", response_model=Dict[str, str])
@@ -121,12 +194,9 @@ async def update_plan(
     Update plan metadata (name, description, notes, risk preference).
     """
     try:
-        success = await plan_service.update_plan(
-            plan_id=plan_id,
-            name=request.name,
-            description=request.description,
-            notes=request.notes,
-            risk_preference=request.risk_preference
+        success = await plan_service.patch_plan(
+            plan_id,
+            request.model_dump(exclude_none=True)
         )
         if not success:
             raise HTTPException(status_code=404, detail="Plan not found")
@@ -187,6 +257,28 @@ async def delete_plan(
         raise HTTPException(status_code=500, detail=str(e))
 
 
+@router.get("/plans/{plan_id}/research", response_model=List[ResearchRun])
+async def get_research_history(
+    plan_id: str,
+    current_user: User = Depends(get_current_user),
+    plan_service: PlanService = Depends(get_plan_service),
+    logger: LoggerService = Depends(get_logger)
+):
+    """
+    Get the full research history of a plan, oldest first.
+
+    Plans only embed their most recent research runs; this includes the archived ones.
+    """
+    try:
+        history = await plan_service.get_research_history(plan_id)
+    except Exception as e:
+        logger.error(f"Error loading research history for plan {plan_id}: {e}")
+        raise HTTPException(status_code=500, detail=str(e))
+    if history is None:
+        raise HTTPException(status_code=404, detail="Plan not found")
+    return history
+
+
 @router.post("/plans/{plan_id}/research")
 async def run_research_on_plan(
     plan_id: str,
@@ -208,12 +300,7 @@ async def run_research_on_plan(
             raise HTTPException(status_code=404, detail="Plan not found")
 
         # Prepare plan context for research agent
-        plan_context = {
-            "plan_name": plan.name,
-            "risk_preference": plan.risk_preference,
-            "optimization_result": plan.optimization_result.model_dump() if plan.optimization_result else None,
-            "initial_amount": plan.initial_amount
-        }
+        plan_context = _get_plan_context(plan)
 
         # Run research agent with plan context
         initial_state = research_agent.get_initial_state({
@@ -230,19 +317,15 @@ async def run_research_on_plan(
         scenarios = result.get("scenarios", {})
         refined_forecasts = result.get("refined_forecasts", {})
 
-        # Convert scenarios to list if needed
-        scenarios_list = []
-        if scenarios:
-            # Flatten scenarios structure
-            for ticker, cases in scenarios.items():
-                for case_name, case_data in cases.items():
-                    scenarios_list.append({
-                        "ticker": ticker,
-                        "case": case_name,
-                        **case_data
-                    })
-
-        # Generate follow-up suggestions from LLM if available
+        # Flatten scenarios structure (ticker -> case -> data) into a list
+        scenarios_list = [
+            {"ticker": ticker, "case": case_name, **case_data}
+            for ticker, cases in (scenarios or {}).items()
+            for case_name, case_data in cases.items()
+        ]
+
+        # Generate follow-up suggestions from LLM if available.
+        # They are stored with the research run, so the run is only written once they are back.
         follow_up_suggestions = None
         if research_agent.llm_service:
             try:
@@ -260,7 +343,8 @@ Return as JSON with key "suggestions" containing a list of questions."""
             except Exception as e:
                 logger.warning(f"Failed to generate follow-up suggestions: {e}")
 
-        # Save research run to plan
+        # Save research run to plan. The plan is re-read right before the write,
+        # so edits made while the agent was running are kept.
         run_id = await plan_service.add_research_run(
             plan_id=plan_id,
             query=request.query,
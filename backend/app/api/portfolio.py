@@ -1,4 +1,8 @@
-from fastapi import APIRouter, Depends, HTTPException, Query
+import asyncio
+from collections import defaultdict
+import numpy as np
+import orjson
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
 from typing import Dict, Optional, Any
 from app.services.portfolio_optimizer import PortfolioOptimizerService
 from app.services.history_service import HistoryService
@@ -8,7 +12,8 @@ from app.services.storage_service import StorageService
 from app.services.logger_service import LoggerService
 from app.services.config_service import ConfigService
 from app.models.portfolio import OptimizationRequest, OptimizationResult, ValidationResult, ValidationError, PortfolioValidationRequest
-from app.core.utils import sanitize_numpy
+from app.core.utils import json_default
+from app.core.http_cache import SHORT_CACHE_CONTROL, etag_matches, json_etag, not_modified
 from app.models.auth import User
 
 router = APIRouter()
@@ -65,7 +70,12 @@ async def get_optimization_status(
     if not job_data:
         raise HTTPException(status_code=404, detail="Job not found")
 
-    return sanitize_numpy(job_data)
+    # Jobs are stored as OptimizationResult dumps, so skip re-validating the (large) payload
+    # through the response model. orjson writes NaN/Infinity as null, like sanitize_numpy.
+    return Response(
+        content=orjson.dumps(job_data, default=json_default, option=orjson.OPT_SERIALIZE_NUMPY),
+        media_type="application/json"
+    )
 
 
 @router.delete("/optimize/cache")
@@ -117,15 +127,13 @@ async def validate_portfolio_holdings(
 
         base_currency = plan_data.get("base_currency", "JPY")
 
-        # Get account limits from strategies config
-        account_limits = config_service.get_account_limits()
+        # Get account limits from strategies config (reads YAML from disk)
+        account_limits = await asyncio.to_thread(config_service.get_account_limits)
 
         # Sum holdings by account_type (all values already in base_currency)
-        account_totals: Dict[str, float] = {}
+        account_totals: Dict[str, float] = defaultdict(float)
         for holding in holdings:
-            account_type = holding.account_type
-            value = holding.monetary_value
-            account_totals[account_type] = account_totals.get(account_type, 0) + value
+            account_totals[holding.account_type] += holding.monetary_value
 
         # Check limits
         errors = []
@@ -157,6 +165,8 @@ async def validate_portfolio_holdings(
 @router.get("/etfs/available")
 async def get_available_etfs(
     plan_id: str,
+    request: Request,
+    response: Response,
     current_user: User = Depends(get_current_user),
     storage_service: StorageService = Depends(get_storage_service),
     config_service: ConfigService = Depends(get_config_service),
@@ -173,18 +183,34 @@ async def get_available_etfs(
     - Account limits with current usage
     """
     try:
-        # Load plan to get base_currency
-        plan_data = await storage_service.get("plans", plan_id)
+        # Get ETF configurations (in memory, no I/O)
+        etf_configs = config_service.get_all_etfs()
+        etf_count = len(etf_configs) if etf_configs else 0
+        logger.info(f"Retrieved {etf_count} ETF configs")
+
+        # Materialize the ETF fields in a single pass as parallel lists (structure of arrays)
+        symbols, names, markets, native_currencies = [], [], [], []
+        market_currencies = set()
+        for etf in etf_configs or []:
+            market = etf.market
+            currency = CurrencyService.get_market_currency(market)
+            symbols.append(etf.symbol)
+            names.append(etf.name)
+            markets.append(market)
+            native_currencies.append(currency)
+            market_currencies.add(currency)
+
+        # Load plan (for base_currency) and batch fetch all prices concurrently.
+        # Price lookups are coalesced with concurrent requests into one provider call.
+        plan_data, prices = await asyncio.gather(
+            storage_service.get("plans", plan_id),
+            history_service.get_latest_prices_batched(symbols)
+        )
         if not plan_data:
             raise HTTPException(status_code=404, detail="Plan not found")
 
         base_currency = plan_data.get("base_currency", "JPY")
 
-        # Get ETF configurations
-        etf_configs = config_service.get_all_etfs()
-        etf_count = len(etf_configs) if etf_configs else 0
-        logger.info(f"Retrieved {etf_count} ETF configs")
-
         if not etf_configs or etf_count == 0:
             # Return empty list if no ETFs configured
             return {
@@ -193,62 +219,56 @@ async def get_available_etfs(
                 "base_currency": base_currency
             }
 
-        # Batch fetch all prices using HistoryService (uses mock in test mode)
-        symbols = [etf.symbol for etf in etf_configs]
-        prices = history_service.get_latest_prices(symbols)
         logger.info(f"Fetched prices for {len(prices)} ETFs")
 
         # Pre-fetch FX rates we might need (avoid repeated lookups in loop)
-        fx_rates = {}
-        currencies_needed = set(
-            CurrencyService.get_market_currency(etf.market)
-            for etf in etf_configs
-        )
-        for curr in currencies_needed:
-            if curr != base_currency:
-                fx_rates[curr] = await currency_service.get_current_rate(curr, base_currency)
+        currencies_needed = market_currencies - {base_currency}
+        # Rate lookups are fetched concurrently and shared with concurrent requests
+        fx_rates = await currency_service.get_current_rates(currencies_needed, base_currency)
+
 
+        # Convert all prices to base currency in one vectorized step (missing prices are NaN).
+        # The base currency has no FX rate and converts at 1.0; a failed rate lookup has already raised.
+        native_prices = np.fromiter(
+            (np.nan if prices.get(symbol) is None else prices[symbol] for symbol in symbols),
+            dtype=np.float64, count=etf_count
+        )
+        rates = np.fromiter(
+            (fx_rates.get(currency, 1.0) for currency in native_currencies), dtype=np.float64, count=etf_count
+        )
+        missing = np.isnan(native_prices)
+        base_prices = (native_prices * rates).tolist()
 
-        # Get current prices and convert to base currency
         etfs = []
-        for etf in etf_configs:
-            native_price = prices.get(etf.symbol)
-            if native_price is None:
-                logger.warning(f"No price for {etf.symbol}")
+        for symbol, name, market, native_currency, price_base, is_missing in zip(
+            symbols, names, markets, native_currencies, base_prices, missing
+        ):
+            if is_missing:
+                logger.warning(f"No price for {symbol}")
                 continue
 
-            native_currency = CurrencyService.get_market_currency(etf.market)
-
-            # Convert to base currency if needed
-            if native_currency != base_currency:
-                rate = fx_rates.get(native_currency, 1.0)
-                price_base = native_price * rate
-            else:
-                price_base = native_price
-
             etfs.append({
-                "symbol": etf.symbol,
-                "name": etf.name,
+                "symbol": symbol,
+                "name": name,
                 "eligible_accounts": ['taxable'],  # Default, can be extended in config
-                "market": etf.market,
+                "market": market,
                 "native_currency": native_currency,
+                # Python's round, not np.round, which rounds some halves differently
                 "current_price_base": round(price_base, 2)
             })
 
-        # Get account limits and calculate usage
-        account_limits = config_service.get_account_limits()
+        # Get account limits (reads YAML from disk) and calculate usage
+        account_limits = await asyncio.to_thread(config_service.get_account_limits)
         account_limits_info = {}
 
         # Calculate current usage from plan's initial_portfolio
         initial_portfolio = plan_data.get("initial_portfolio") or []
         logger.info(f"Initial portfolio has {len(initial_portfolio)} assets")
 
-        account_usage: Dict[str, float] = {}
+        account_usage: Dict[str, float] = defaultdict(float)
         for asset in initial_portfolio:
-            account_type = asset.get("account_type", "taxable")
             # Support both 'amount' (PortfolioAsset) and 'monetary_value' (AssetHolding)
-            value = asset.get("monetary_value") or asset.get("amount", 0)
-            account_usage[account_type] = account_usage.get(account_type, 0) + value
+            account_usage[asset.get("account_type", "taxable")] += asset.get("monetary_value") or asset.get("amount") or 0
 
         logger.info(f"Account limits keys: {list(account_limits.keys()) if account_limits else 'None'}")
 
@@ -263,22 +283,26 @@ async def get_available_etfs(
         else:
             logger.warning("account_limits is None or empty")
 
-        return {
+        payload = {
             "etfs": etfs,
             "account_limits": account_limits_info,
             "base_currency": base_currency
         }
+        # Prices and limits change rarely while the UI polls, so let clients revalidate cheaply
+        etag = json_etag(payload)
+        if etag_matches(request, etag):
+            return not_modified(etag)
+        response.headers["ETag"] = etag
+        response.headers["Cache-Control"] = SHORT_CACHE_CONTROL
+        return payload
 
     except HTTPException:
         raise
     except Exception as e:
-        import traceback
-        logger.error(f"Error getting available ETFs: {e}\n{traceback.format_exc()}")
+        logger.exception(f"Error getting available ETFs: {e}")
         raise HTTPException(status_code=500, detail=str(e))
 
 
 def format_currency(value: float, currency: str) -> str:
     """Format monetary value with currency symbol"""
-    symbols = {"JPY": "¥", "USD": "$", "EUR": "€"}
-    symbol = symbols.get(currency, currency)
-    return f"{symbol}{value:,.0f}"
+    return f"{CurrencyService.CURRENCY_SYMBOLS.get(currency, currency)}{value:,.0f}"
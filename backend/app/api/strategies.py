@@ -1,10 +1,13 @@
-from fastapi import APIRouter, HTTPException, Query, Depends
-from typing import List, Dict, Any, Optional
+from fastapi import APIRouter, HTTPException, Query, Depends, Request, Response
+from typing import List, Dict, Any, Optional, Tuple
 from app.services.config_service import ConfigService
 from app.core.dependencies import get_config_service, get_logger, get_current_user
 from app.services.logger_service import LoggerService
 from app.models.auth import User
+from app.core.http_cache import SHORT_CACHE_CONTROL, etag_matches, not_modified
+import hashlib
 import yaml
+from functools import lru_cache
 from pathlib import Path
 
 router = APIRouter()
@@ -13,11 +16,33 @@ router = APIRouter()
 STRATEGIES_CONFIG_PATH = Path(__file__).parent.parent.parent / "config" / "strategies_config.yaml"
 
 
-def _load_strategies_config() -> Dict[str, Any]:
-    """Load the strategies configuration from YAML file."""
+# libyaml's C loader is much faster; fall back to the pure-Python one if it is not compiled in
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+
+@lru_cache(maxsize=1)
+def _parse_strategies_config(mtime: float) -> Tuple[Dict[str, Any], Dict[str, Dict[str, Any]], str]:
+    """
+    Parse the strategies YAML, index strategies by id and hash the file contents.
+    Cached per file mtime, so the results are shared and must not be mutated.
+    """
+    raw = STRATEGIES_CONFIG_PATH.read_bytes()
+    config = yaml.load(raw, Loader=_YAML_LOADER)
+    by_id: Dict[str, Dict[str, Any]] = {}
+    for strategy in config.get("strategies", []):
+        if "strategy_id" in strategy:
+            # First match wins on duplicate ids, like the linear lookup this replaces
+            by_id.setdefault(strategy["strategy_id"], strategy)
+    return config, by_id, hashlib.blake2b(raw, digest_size=8).hexdigest()
+
+
+def _load_strategies_config() -> Tuple[Dict[str, Any], Dict[str, Dict[str, Any]], str]:
+    """
+    Load the strategies configuration from YAML file, re-parsing only when it changes.
+    Returns the config, a strategy_id -> strategy index and a version for ETags.
+    """
     try:
-        with open(STRATEGIES_CONFIG_PATH, "r") as f:
-            return yaml.safe_load(f)
+        return _parse_strategies_config(STRATEGIES_CONFIG_PATH.stat().st_mtime)
     except FileNotFoundError:
         # Return default config if file doesn't exist
         return {
@@ -27,11 +52,13 @@ def _load_strategies_config() -> Dict[str, Any]:
                 "long_term_capital_gains_rate": 0.15,
                 "account_types": {}
             }
-        }
+        }, {}, "default"
 
 
 @router.get("/strategies", response_model=List[Dict[str, Any]])
 async def list_strategies(
+    request: Request,
+    response: Response,
     risk_level: Optional[str] = Query(None, description="Filter by risk level (conservative, moderate, aggressive)"),
     current_user: User = Depends(get_current_user),
     config_service: ConfigService = Depends(get_config_service),
@@ -40,8 +67,15 @@ async def list_strategies(
     """
     List all available strategy templates.
     Can optionally filter by risk level.
+    Honors If-None-Match with a 304 while the strategies config is unchanged.
     """
-    config = _load_strategies_config()
+    config, _, version = _load_strategies_config()
+    etag = f'"{version}-{risk_level or "all"}"'
+    if etag_matches(request, etag):
+        return not_modified(etag)
+    response.headers["ETag"] = etag
+    response.headers["Cache-Control"] = SHORT_CACHE_CONTROL
+
     strategies = config.get("strategies", [])
 
     # Filter by risk level if provided
@@ -54,20 +88,25 @@ async def list_strategies(
 @router.get("/strategies/{strategy_id}", response_model=Dict[str, Any])
 async def get_strategy(
     strategy_id: str,
+    request: Request,
+    response: Response,
     current_user: User = Depends(get_current_user),
     logger: LoggerService = Depends(get_logger)
 ):
     """
     Get details of a specific strategy template.
     """
-    config = _load_strategies_config()
-    strategies = config.get("strategies", [])
-
-    for strategy in strategies:
-        if strategy.get("strategy_id") == strategy_id:
-            return strategy
+    _, strategies_by_id, version = _load_strategies_config()
+    strategy = strategies_by_id.get(strategy_id)
+    if strategy is None:
+        raise HTTPException(status_code=404, detail=f"Strategy '{strategy_id}' not found")
 
-    raise HTTPException(status_code=404, detail=f"Strategy '{strategy_id}' not found")
+    etag = f'"{version}-{strategy_id}"'
+    if etag_matches(request, etag):
+        return not_modified(etag)
+    response.headers["ETag"] = etag
+    response.headers["Cache-Control"] = SHORT_CACHE_CONTROL
+    return strategy
 
 
 @router.get("/config/tax-settings", response_model=Dict[str, Any])
@@ -78,6 +117,6 @@ async def get_tax_settings(
     """
     Get tax settings for different account types.
     """
-    config = _load_strategies_config()
+    config, _, _ = _load_strategies_config()
     tax_settings = config.get("tax_settings", {})
     return tax_settings
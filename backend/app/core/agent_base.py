@@ -1,14 +1,20 @@
 from abc import ABC, abstractmethod
-from typing import Any, Dict, Optional
-import datetime
-import uuid
+from typing import Any, Callable, Dict, List, Optional
+import os
 from app.services.logger_service import LoggerService
 from app.services.storage_service import StorageService
+from app.core.batching import BatchWriter
+from app.core.utils import utc_now_iso
 
 class AgentBase(ABC):
     def __init__(self, logger: LoggerService, storage: StorageService):
         self.logger = logger
         self.storage = storage
+        # Called with each step record as soon as it is queued (e.g. to stream progress),
+        # before it is persisted: the record may not be in storage until flush_logs completes
+        self.step_listeners: List[Callable[[Dict[str, Any]], None]] = []
+        # Step records are written behind in batches; see flush_logs
+        self._log_writer = BatchWriter(storage, "agent_logs", logger)
 
     @abstractmethod
     async def run(self, run_id: str, input_data: Any) -> Any:
@@ -16,7 +22,7 @@ class AgentBase(ABC):
 
     async def log_step(self, run_id: str, step_name: str, status: str, details: Optional[Dict[str, Any]] = None):
         """
-        Logs a step to the logger and saves it to Firestore for monitoring.
+        Logs a step to the logger and queues it to be saved to Firestore for monitoring.
         """
         message = f"[{run_id}] Step: {step_name} - Status: {status}"
         if details:
@@ -30,12 +36,19 @@ class AgentBase(ABC):
             "step": step_name,
             "status": status,
             "details": details or {},
-            "timestamp": datetime.datetime.now(datetime.timezone.utc).isoformat()
+            "timestamp": utc_now_iso()
         }
         
         # We append to a subcollection or list for the run. 
         # For simplicity in this implementation, we'll just save unrelated log entries 
         # that can be queried by run_id, or append to a list in the run document.
         # Let's assume we save individual log entries to a 'agent_logs' collection.
-        log_id = str(uuid.uuid4())
-        await self.storage.save("agent_logs", log_id, step_data)
+        log_id = os.urandom(16).hex()
+        self._log_writer.add(log_id, step_data)
+
+        for listener in self.step_listeners:
+            listener(step_data)
+
+    async def flush_logs(self):
+        """Wait until every logged step has been saved to storage."""
+        await self._log_writer.flush()
@@ -0,0 +1,152 @@
+import asyncio
+from typing import Any, Awaitable, Callable, Dict, Generic, Hashable, Iterable, List, Optional, Set, TypeVar
+
+from app.services.logger_service import LoggerService
+from app.services.storage_service import StorageService
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+
+class AsyncBatcher(Generic[K, V]):
+    """
+    Coalesces concurrent single-key lookups into one batched upstream call.
+
+    Keys requested within `max_wait_ms` of the first pending key (or until
+    `max_batch` keys are pending) are fetched together with `fetch_many`, and
+    callers asking for the same key share one result. Keys missing from the
+    batch result resolve to None; exception values are raised to the callers
+    of that key only.
+    """
+
+    def __init__(
+        self,
+        fetch_many: Callable[[List[K]], Awaitable[Dict[K, V]]],
+        max_wait_ms: float = 10,
+        max_batch: int = 128,
+    ):
+        self._fetch_many = fetch_many
+        self.max_wait = max_wait_ms / 1000
+        self.max_batch = max_batch
+        self._pending: Dict[K, asyncio.Future] = {}
+        self._flush_handle: Optional[asyncio.TimerHandle] = None
+        # Keep references to running batches so they are not garbage collected
+        self._running: Set[asyncio.Task] = set()
+
+    async def load(self, key: K) -> Optional[V]:
+        future = self._pending.get(key)
+        if future is None:
+            loop = asyncio.get_running_loop()
+            future = loop.create_future()
+            self._pending[key] = future
+            if len(self._pending) >= self.max_batch:
+                self._flush()
+            elif self._flush_handle is None:
+                self._flush_handle = loop.call_later(self.max_wait, self._flush)
+        # Shielded so a cancelled caller does not cancel the result for the others
+        return await asyncio.shield(future)
+
+    async def load_many(self, keys: Iterable[K]) -> Dict[K, Optional[V]]:
+        keys = list(keys)
+        values = await asyncio.gather(*(self.load(key) for key in keys))
+        return dict(zip(keys, values))
+
+    def _flush(self) -> None:
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        batch, self._pending = self._pending, {}
+        if batch:
+            task = asyncio.create_task(self._run(batch))
+            self._running.add(task)
+            task.add_done_callback(self._running.discard)
+
+    async def _run(self, batch: Dict[K, asyncio.Future]) -> None:
+        try:
+            results = await self._fetch_many(list(batch))
+        except Exception as e:
+            for future in batch.values():
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        for key, future in batch.items():
+            if future.done():
+                continue
+            value = results.get(key)
+            if isinstance(value, BaseException):
+                future.set_exception(value)
+            else:
+                future.set_result(value)
+
+
+class BatchWriter:
+    """
+    Write-behind buffer that saves documents to one collection in batches.
+
+    `add` returns immediately; pending documents are written with a single
+    `save_many` once `max_batch` are queued or `max_wait_ms` after the first
+    one. `write` adds a document and waits until its batch is written. Call
+    `flush` to wait until everything added so far is stored.
+    Write failures are logged, not raised.
+    """
+
+    def __init__(
+        self,
+        storage: StorageService,
+        collection: str,
+        logger: LoggerService,
+        max_wait_ms: float = 50,
+        max_batch: int = 500,
+    ):
+        self.storage = storage
+        self.collection = collection
+        self.logger = logger
+        self.max_wait = max_wait_ms / 1000
+        self.max_batch = max_batch
+        self._pending: Dict[str, Dict[str, Any]] = {}
+        self._flush_handle: Optional[asyncio.TimerHandle] = None
+        self._writes: Set[asyncio.Task] = set()
+        # Resolved when the pending batch has been written
+        self._pending_done: Optional[asyncio.Future] = None
+
+    async def write(self, id: str, data: Dict[str, Any]) -> None:
+        """Add a document and wait until the batch it joined is written."""
+        if self._pending_done is None:
+            self._pending_done = asyncio.get_running_loop().create_future()
+        done = self._pending_done
+        self.add(id, data)
+        # Shielded so a cancelled caller does not cancel the result for the others
+        await asyncio.shield(done)
+
+    def add(self, id: str, data: Dict[str, Any]) -> None:
+        self._pending[id] = data
+        if len(self._pending) >= self.max_batch:
+            self._start_write()
+        elif self._flush_handle is None:
+            self._flush_handle = asyncio.get_running_loop().call_later(self.max_wait, self._start_write)
+
+    async def flush(self) -> None:
+        self._start_write()
+        if self._writes:
+            await asyncio.gather(*self._writes)
+
+    def _start_write(self) -> None:
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        batch, self._pending = self._pending, {}
+        done, self._pending_done = self._pending_done, None
+        if batch:
+            task = asyncio.create_task(self._write(batch, done))
+            self._writes.add(task)
+            task.add_done_callback(self._writes.discard)
+
+    async def _write(self, batch: Dict[str, Dict[str, Any]], done: Optional[asyncio.Future] = None) -> None:
+        try:
+            await self.storage.save_many(self.collection, batch)
+        except Exception as e:
+            self.logger.error(f"Failed to write {len(batch)} documents to {self.collection}: {e}")
+        finally:
+            if done is not None and not done.done():
+                done.set_result(None)
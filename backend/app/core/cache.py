@@ -0,0 +1,94 @@
+import datetime
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, Optional
+
+from app.core.utils import sanitize_numpy, utc_now_iso
+from app.services.logger_service import LoggerService
+from app.services.storage_service import StorageService
+
+
+class TTLCache:
+    """
+    Small in-process LRU cache whose entries expire after a time-to-live.
+
+    Not shared between worker processes; use it for values that are cheap to
+    recompute and where a short staleness window is acceptable.
+    """
+
+    def __init__(self, maxsize: int, ttl: float):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: "OrderedDict[Hashable, tuple[float, Any]]" = OrderedDict()
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        entry = self._data.get(key)
+        if entry is None:
+            return default
+        expires_at, value = entry
+        if time.monotonic() >= expires_at:
+            del self._data[key]
+            return default
+        self._data.move_to_end(key)
+        return value
+
+    def set(self, key: Hashable, value: Any, ttl: Optional[float] = None) -> None:
+        """Store a value. `ttl` overrides the cache-wide TTL for this entry."""
+        self._data[key] = (time.monotonic() + (self.ttl if ttl is None else ttl), value)
+        self._data.move_to_end(key)
+        while len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+
+    def pop(self, key: Hashable, default: Any = None) -> Any:
+        entry = self._data.pop(key, None)
+        return default if entry is None else entry[1]
+
+    def clear(self) -> None:
+        self._data.clear()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+
+class StoredResultCache:
+    """
+    Results of expensive computations kept in a storage collection and reused
+    for `ttl_hours`, so they are shared between workers and restarts.
+
+    Caching is optional: storage errors are logged and treated as misses.
+    A `ttl_hours` of 0 disables it.
+    """
+
+    def __init__(self, storage: StorageService, collection: str, ttl_hours: float, logger: LoggerService):
+        self.storage = storage
+        self.collection = collection
+        self.ttl_hours = ttl_hours
+        self.logger = logger
+
+    @property
+    def enabled(self) -> bool:
+        return self.ttl_hours > 0
+
+    async def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """The cached entry (`id`, `created_at`, `result`) if available and fresh."""
+        try:
+            cached = await self.storage.get(self.collection, key)
+            if not cached:
+                return None
+            created_at = datetime.datetime.fromisoformat(cached["created_at"])
+            age = datetime.datetime.now(datetime.timezone.utc) - created_at
+            if age < datetime.timedelta(hours=self.ttl_hours):
+                return cached
+        except Exception as e:
+            self.logger.warning(f"Ignoring cached entry {self.collection}/{key}: {e}")
+        return None
+
+    async def save(self, key: str, result: Any) -> None:
+        try:
+            await self.storage.save(self.collection, key, {
+                "id": key,
+                "created_at": utc_now_iso(),
+                "result": sanitize_numpy(result)
+            })
+        except Exception as e:
+            self.logger.warning(f"Failed to cache {self.collection}/{key}: {e}")
@@ -0,0 +1,18 @@
+import functools
+import os
+from typing import Any, Callable, TypeVar
+
+from anyio import CapacityLimiter, to_thread
+
+T = TypeVar("T")
+
+# Dedicated thread budgets per kind of blocking work, so a burst of one kind
+# (e.g. registrations hashing passwords) cannot starve the others or the
+# default executor used for storage I/O.
+password_hash_limiter = CapacityLimiter(os.cpu_count() or 1)
+llm_limiter = CapacityLimiter(int(os.getenv("LLM_THREAD_LIMIT", "8")))
+
+
+async def run_limited(limiter: CapacityLimiter, func: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+    """Run a blocking function in a worker thread, holding a slot of `limiter`."""
+    return await to_thread.run_sync(functools.partial(func, *args, **kwargs), limiter=limiter)
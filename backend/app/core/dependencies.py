@@ -1,56 +1,115 @@
 import os
-from functools import lru_cache
-from typing import Any
-from fastapi import Depends
-from app.services.agent_service import AgentService
+import time
+import hashlib
+from functools import partial, wraps
+from typing import Any, Awaitable, Callable, Dict, TypeVar
+from fastapi import Depends, HTTPException, status
+from app.services.agent_service import AgentFactory, AgentService
 from app.services.news.alpha_vantage_provider import AlphaVantageProvider
 from app.services.news.mock_news_provider import MockNewsProvider
 from app.services.news_service import NewsService
 from app.services.history_service import HistoryService
+from app.services.history.mock_history_provider import MockHistoryProvider
 from app.services.config_service import ConfigService
+from app.services.currency_service import CurrencyService
+from app.services.currency.mock_currency_provider import MockCurrencyProvider
+from app.services.llm_service import LLMService
+from app.services.forecasting_engine import ForecastingEngine
+from app.services.macro_service import MacroService
+from app.services.risk_calculators import RiskCalculator
+from app.services.portfolio_optimizer import PortfolioOptimizerService
+from app.services.plan_service import PlanService
+from app.services.research_agent import ResearchAgent
 from app.services.logger_service import LoggerService
 from app.infrastructure.logging.std_logger import StdLogger
-from app.infrastructure.logging.std_logger import StdLogger
 from app.services.auth_service import AuthService, JWTAuthService, oauth2_scheme
+from app.services.auth.mock_user_provider import MockUserProvider
+from app.services.auth.storage_user_provider import StorageUserProvider
 from app.models.auth import User
-from fastapi import HTTPException, status
 from app.services.storage_service import StorageService
 from app.infrastructure.storage.firestore_storage import FirestoreStorage
+from app.core.cache import TTLCache
 
-@lru_cache()
-def get_logger() -> LoggerService:
-    return StdLogger()
+# Provider selection is fixed at import; providers are singletons, so later env changes never applied anyway.
+# Select user provider with AUTH_PROVIDER (default: mock for safety)
+_AUTH_PROVIDER = os.getenv("AUTH_PROVIDER", "mock")
+# Default to Mock market data unless explicitly enabled (Safety first)
+_ENABLE_YFINANCE = os.getenv("ENABLE_YFINANCE", "false").lower() in {"1", "true", "yes"}
+_ALPHA_VANTAGE_API_KEY = os.getenv("ALPHA_VANTAGE_API_KEY")
 
-@lru_cache()
-def get_storage_service() -> StorageService:
-    return FirestoreStorage()
+# Users resolved from access tokens, keyed by token digest.
+# Entries never outlive the token itself (see get_current_user).
+_current_user_cache = TTLCache(maxsize=10_000, ttl=60)
+
+
+def _token_cache_key(token: str) -> bytes:
+    return hashlib.blake2b(token.encode(), digest_size=16).digest()
+
+T = TypeVar("T")
+
+# Provider instances, keyed by getter name. Cleared by _reset_singletons().
+_singletons: Dict[str, Any] = {}
+
+
+def async_singleton(factory: Callable[[], Awaitable[T]]) -> Callable[[], Awaitable[T]]:
+    """
+    Cache the result of a zero-argument async provider in `_singletons`. The hit path is a
+    single dict lookup; lru_cache would also cache the coroutine instead of its result.
+
+    Providers only construct objects and never suspend, so concurrent first calls cannot
+    build two instances.
+    """
+    key = factory.__name__
 
-@lru_cache()
-def get_config_service(
-    storage: StorageService = Depends(get_storage_service)
-) -> ConfigService:
-    return ConfigService(storage_service=storage)
+    @wraps(factory)
+    async def getter() -> T:
+        instance = _singletons.get(key)
+        if instance is None:
+            instance = _singletons[key] = await factory()
+        return instance
 
-@lru_cache()
-def get_auth_service() -> AuthService:
-    from app.services.auth.mock_user_provider import MockUserProvider
-    from app.services.auth.storage_user_provider import StorageUserProvider
+    return getter
 
-    # Select provider based on AUTH_PROVIDER env var (default: mock for safety)
-    auth_provider = os.getenv("AUTH_PROVIDER", "mock")
 
-    if auth_provider == "storage":
-        user_provider = StorageUserProvider(get_storage_service())
+def _reset_singletons() -> None:
+    """Drop all provider instances so the next call builds new ones (e.g. between tests)."""
+    _singletons.clear()
+
+
+# Singleton getters take no parameters and call each other directly. FastAPI only resolves the
+# getter a route depends on, instead of walking the whole provider graph per request. They are
+# async so FastAPI calls them on the event loop instead of dispatching each one to the thread pool.
+@async_singleton
+async def get_logger() -> LoggerService:
+    return StdLogger()
+
+@async_singleton
+async def get_storage_service() -> StorageService:
+    return FirestoreStorage()
+
+@async_singleton
+async def get_config_service() -> ConfigService:
+    return ConfigService(storage_service=await get_storage_service())
+
+@async_singleton
+async def get_auth_service() -> AuthService:
+    if _AUTH_PROVIDER == "storage":
+        user_provider = StorageUserProvider(await get_storage_service())
     else:
         user_provider = MockUserProvider()
 
     # We inject storage service to support token revocation
-    return JWTAuthService(user_provider, storage_service=get_storage_service())
+    return JWTAuthService(user_provider, storage_service=await get_storage_service())
 
 async def get_current_user(
     token: str = Depends(oauth2_scheme),
     auth_service: AuthService = Depends(get_auth_service)
 ) -> User:
+    cache_key = _token_cache_key(token)
+    cached_user = _current_user_cache.get(cache_key)
+    if cached_user is not None:
+        return cached_user
+
     credentials_exception = HTTPException(
         status_code=status.HTTP_401_UNAUTHORIZED,
         detail="Could not validate credentials",
@@ -75,7 +134,18 @@ async def get_current_user(
     # if not user: raise credentials_exception
     
     role = payload.get("role", "user")
-    return User(username=username, role=role)
+    user = User(username=username, role=role)
+
+    # Cache until the token expires, capped by the cache TTL
+    expires_in = payload.get("exp", 0) - time.time()
+    if expires_in > 0:
+        _current_user_cache.set(cache_key, user, ttl=min(expires_in, _current_user_cache.ttl))
+    return user
+
+
+def invalidate_current_user(token: str) -> None:
+    """Forget the cached user for an access token, e.g. on logout."""
+    _current_user_cache.pop(_token_cache_key(token))
 
 async def get_current_user_optional(
     token: str | None = Depends(oauth2_scheme), # Optional dependency? No, Depends(oauth2_scheme) throws if missing usually unless auto_error=False
@@ -92,189 +162,107 @@ async def get_current_user_optional(
 
 
 
-@lru_cache()
-def get_currency_service(
-    storage_service: StorageService = Depends(get_storage_service),
-    logger_service: LoggerService = Depends(get_logger)
-) -> Any:
-    # Choose provider based on config
-    # Default to Mock unless explicitly enabled (Safety first)
-    enable_yfinance = os.getenv("ENABLE_YFINANCE", "false").lower() in ["1", "true", "yes"]
-    
-    if enable_yfinance:
+@async_singleton
+async def get_currency_service() -> CurrencyService:
+    if _ENABLE_YFINANCE:
         from app.services.currency.yfinance_currency_provider import YFinanceCurrencyProvider
         provider = YFinanceCurrencyProvider()
     else:
-        from app.services.currency.mock_currency_provider import MockCurrencyProvider
         provider = MockCurrencyProvider()
         
-    from app.services.currency_service import CurrencyService
-    return CurrencyService(storage_service, logger_service, provider)
+    return CurrencyService(await get_storage_service(), await get_logger(), provider)
 
 
-@lru_cache()
-def get_news_service(
-    config_service: ConfigService = Depends(get_config_service),
-    storage: StorageService = Depends(get_storage_service),
-    logger: LoggerService = Depends(get_logger)
-) -> NewsService:
-    if os.getenv("ALPHA_VANTAGE_API_KEY"):
+@async_singleton
+async def get_news_service() -> NewsService:
+    if _ALPHA_VANTAGE_API_KEY:
         provider = AlphaVantageProvider()
     else:
         provider = MockNewsProvider()
-    ttl = config_service.get_news_ttl_hours()
-    return NewsService(provider=provider, storage=storage, logger=logger, ttl_hours=ttl)
-
-@lru_cache()
-def get_history_service(
-    storage: StorageService = Depends(get_storage_service),
-    logger: LoggerService = Depends(get_logger)
-) -> HistoryService:
-    from app.services.history.yfinance_provider import YFinanceProvider
-    from app.services.history.mock_history_provider import MockHistoryProvider
-    
-    # Default to Mock unless explicitly enabled (Safety first)
-    enable_yfinance = os.getenv("ENABLE_YFINANCE", "false").lower() in ["1", "true", "yes"]
-    
-    if not enable_yfinance:
+    ttl = (await get_config_service()).get_news_ttl_hours()
+    return NewsService(provider=provider, storage=await get_storage_service(), logger=await get_logger(), ttl_hours=ttl)
+
+@async_singleton
+async def get_history_service() -> HistoryService:
+    logger = await get_logger()
+    if not _ENABLE_YFINANCE:
         logger.info("Initializing Mock History Provider (ENABLE_YFINANCE=False)")
         provider = MockHistoryProvider()
     else:
+        from app.services.history.yfinance_provider import YFinanceProvider
         logger.info("Initializing YFinance History Provider")
         provider = YFinanceProvider()
         
-    return HistoryService(storage, logger, provider)
-
-@lru_cache()
-def get_llm_service(
-    config: ConfigService = Depends(get_config_service),
-    storage: StorageService = Depends(get_storage_service)
-) -> Any:
-    from app.services.llm_service import LLMService
-    return LLMService(config_service=config, storage_service=storage)
-
-@lru_cache()
-def get_forecasting_engine(
-    history_service: HistoryService = Depends(get_history_service),
-    config_service: ConfigService = Depends(get_config_service),
-    storage_service: StorageService = Depends(get_storage_service),
-    logger: LoggerService = Depends(get_logger)
-) -> Any:
-    from app.services.forecasting_engine import ForecastingEngine
-    return ForecastingEngine(history_service, logger, config_service, storage_service)
-
-@lru_cache()
-def get_macro_service(
-    storage: StorageService = Depends(get_storage_service),
-    logger: LoggerService = Depends(get_logger)
-) -> Any:
-    from app.services.macro_service import MacroService
-    return MacroService(storage, logger)
-
-@lru_cache()
-def get_risk_calculator() -> Any:
-    from app.services.risk_calculators import RiskCalculator
+    return HistoryService(await get_storage_service(), logger, provider)
+
+@async_singleton
+async def get_llm_service() -> LLMService:
+    return LLMService(config_service=await get_config_service(), storage_service=await get_storage_service())
+
+@async_singleton
+async def get_forecasting_engine() -> ForecastingEngine:
+    return ForecastingEngine(
+        await get_history_service(), await get_logger(), await get_config_service(), await get_storage_service()
+    )
+
+@async_singleton
+async def get_macro_service() -> MacroService:
+    return MacroService(await get_storage_service(), await get_logger())
+
+@async_singleton
+async def get_risk_calculator() -> RiskCalculator:
     return RiskCalculator()
 
-@lru_cache()
-def get_agent_service(
-    news_service: NewsService = Depends(get_news_service),
-    history_service: HistoryService = Depends(get_history_service),
-    llm_service: Any = Depends(get_llm_service),
-    forecasting_engine: Any = Depends(get_forecasting_engine),
-    macro_service: Any = Depends(get_macro_service),
-    risk_calculator: Any = Depends(get_risk_calculator),
-    config_service: ConfigService = Depends(get_config_service)
-) -> AgentService:
-    logger = get_logger()
-    storage = get_storage_service()
-    service = AgentService(logger=logger, storage=storage)
-
-    # Register Agents
-    from app.services.research_agent import ResearchAgent
-
-    # Create a dynamic subclass that has the services bound
-    class ConfiguredResearchAgent(ResearchAgent):
-        def __init__(self, logger: LoggerService, storage: StorageService):
-            super().__init__(
-                logger,
-                storage,
-                news_service=news_service,
-                history_service=history_service,
-                llm_service=llm_service,
-                forecasting_engine=forecasting_engine,
-                macro_service=macro_service,
-                risk_calculator=risk_calculator,
-                config_service=config_service
-            )
-
-    service.register_agent("research", ConfiguredResearchAgent)
+
+async def _research_agent_factory() -> AgentFactory:
+    """ResearchAgent constructor with its services bound; takes (logger, storage)."""
+    return partial(
+        ResearchAgent,
+        news_service=await get_news_service(),
+        history_service=await get_history_service(),
+        llm_service=await get_llm_service(),
+        forecasting_engine=await get_forecasting_engine(),
+        macro_service=await get_macro_service(),
+        risk_calculator=await get_risk_calculator(),
+        config_service=await get_config_service()
+    )
+
+
+@async_singleton
+async def get_agent_service() -> AgentService:
+    service = AgentService(logger=await get_logger(), storage=await get_storage_service())
+
+    # Register Agents, with their services bound once
+    service.register_agent("research", await _research_agent_factory())
 
     return service
 
-@lru_cache()
-def get_portfolio_optimizer_service(
-    history_service: HistoryService = Depends(get_history_service),
-    config_service: ConfigService = Depends(get_config_service),
-    storage_service: StorageService = Depends(get_storage_service),
-    currency_service: Any = Depends(get_currency_service),
-    forecasting_engine: Any = Depends(get_forecasting_engine),
-    llm_service: Any = Depends(get_llm_service),
-    macro_service: Any = Depends(get_macro_service),
-    risk_calculator: Any = Depends(get_risk_calculator)
-) -> Any:
-    from app.services.portfolio_optimizer import PortfolioOptimizerService
-    logger = get_logger()
+@async_singleton
+async def get_portfolio_optimizer_service() -> PortfolioOptimizerService:
     return PortfolioOptimizerService(
-        history_service,
-        config_service,
-        storage_service,
-        logger,
-        currency_service,
-        forecasting_engine,
-        llm_service,
-        macro_service,
-        risk_calculator
+        await get_history_service(),
+        await get_config_service(),
+        await get_storage_service(),
+        await get_logger(),
+        await get_currency_service(),
+        await get_forecasting_engine(),
+        await get_llm_service(),
+        await get_macro_service(),
+        await get_risk_calculator()
     )
 
 
-@lru_cache()
-def get_plan_service(
-    storage_service: StorageService = Depends(get_storage_service),
-    config_service: ConfigService = Depends(get_config_service),
-    logger: LoggerService = Depends(get_logger)
-) -> Any:
-    from app.services.plan_service import PlanService
-    return PlanService(storage_service, logger, config_service)
-
-
-@lru_cache()
-def get_research_agent(
-    news_service: NewsService = Depends(get_news_service),
-    history_service: HistoryService = Depends(get_history_service),
-    llm_service: Any = Depends(get_llm_service),
-    forecasting_engine: Any = Depends(get_forecasting_engine),
-    macro_service: Any = Depends(get_macro_service),
-    risk_calculator: Any = Depends(get_risk_calculator),
-    config_service: ConfigService = Depends(get_config_service)
-) -> Any:
-    from app.services.research_agent import ResearchAgent
-    logger = get_logger()
-    storage = get_storage_service()
-    return ResearchAgent(
-        logger=logger,
-        storage=storage,
-        news_service=news_service,
-        history_service=history_service,
-        llm_service=llm_service,
-        forecasting_engine=forecasting_engine,
-        macro_service=macro_service,
-        risk_calculator=risk_calculator,
-        config_service=config_service
-    )
+@async_singleton
+async def get_plan_service() -> PlanService:
+    return PlanService(await get_storage_service(), await get_logger(), await get_config_service())
+
+
+@async_singleton
+async def get_research_agent() -> ResearchAgent:
+    factory = await _research_agent_factory()
+    return factory(await get_logger(), await get_storage_service())
 
 async def get_current_admin_user(current_user: User = Depends(get_current_user)) -> User:
     if current_user.role != "admin":
-        from fastapi import HTTPException
         raise HTTPException(status_code=403, detail="Admin privileges required")
     return current_user
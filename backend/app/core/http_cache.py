@@ -0,0 +1,27 @@
+import hashlib
+from typing import Any
+
+import orjson
+from fastapi import Request, Response
+
+# Config-driven responses change rarely; let the browser reuse them briefly before revalidating
+SHORT_CACHE_CONTROL = "private, max-age=30"
+
+
+def etag_matches(request: Request, etag: str) -> bool:
+    """True if the request's If-None-Match header matches `etag` (weak tags and * included)."""
+    if_none_match = request.headers.get("if-none-match")
+    if not if_none_match:
+        return False
+    candidates = [tag.strip().removeprefix("W/") for tag in if_none_match.split(",")]
+    return etag in candidates or "*" in candidates
+
+
+def json_etag(payload: Any) -> str:
+    """Quoted ETag of a JSON-serializable payload."""
+    digest = hashlib.blake2b(orjson.dumps(payload, option=orjson.OPT_NON_STR_KEYS), digest_size=8).hexdigest()
+    return f'"{digest}"'
+
+
+def not_modified(etag: str, cache_control: str = SHORT_CACHE_CONTROL) -> Response:
+    return Response(status_code=304, headers={"ETag": etag, "Cache-Control": cache_control})
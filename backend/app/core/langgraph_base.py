@@ -1,14 +1,56 @@
+import hashlib
+import os
+import reprlib
 from typing import Any, Dict, Optional, AsyncGenerator
+import orjson
 from langgraph.graph import StateGraph
 from app.core.agent_base import AgentBase
+from app.core.cache import StoredResultCache
+from app.core.utils import json_default
 from app.services.logger_service import LoggerService
 from app.services.storage_service import StorageService
 
+# Bounded repr for step previews: only the first few items of each container are formatted
+_preview_repr = reprlib.Repr()
+_preview_repr.maxlevel = 3
+_preview_repr.maxdict = 8
+_preview_repr.maxlist = 8
+_preview_repr.maxstring = 200
+_preview_repr.maxother = 200
+
+
+def _preview(obj: Any, limit: int = 500) -> str:
+    """Short text preview of a node output, for the UI."""
+    return _preview_repr.repr(obj)[:limit]
+
+
 class LangGraphAgent(AgentBase):
+    # Graphs with side effects beyond their result (other than step logs) should set this to False
+    cache_runs = True
+    run_cache_collection = "agent_run_cache"
+
     def __init__(self, logger: LoggerService, storage: StorageService):
         super().__init__(logger, storage)
+        # Results of runs with the same input are reused for AGENT_RUN_CACHE_TTL_HOURS; 0 disables it
+        self.run_cache = StoredResultCache(
+            storage, self.run_cache_collection, float(os.getenv("AGENT_RUN_CACHE_TTL_HOURS", "0")), logger
+        )
 
     async def run(self, run_id: str, input_data: Any) -> Any:
+        cache_key = self._run_cache_key(input_data)
+        if cache_key:
+            cached = await self.run_cache.get(cache_key)
+            if cached:
+                await self.log_step(run_id, "Cache Hit", "completed", {"cached_at": cached["created_at"]})
+                return cached["result"]
+
+        result = await self._run_graph(run_id, input_data)
+
+        if cache_key:
+            await self.run_cache.save(cache_key, result)
+        return result
+
+    async def _run_graph(self, run_id: str, input_data: Any) -> Any:
         # Build the graph
         graph = self.build_graph()
         
@@ -30,16 +72,28 @@ class LangGraphAgent(AgentBase):
                         run_id, 
                         f"Node: {node_name}", 
                         "completed", 
-                        {"output": str(node_output)[:500]} # Truncate for UI safety
+                        {"output": _preview(node_output)} # Truncate for UI safety
                     )
                     last_state = node_output
 
-            await self.log_step(run_id, "Workflow End", "completed", {"result": str(last_state)[:500]})
+            await self.log_step(run_id, "Workflow End", "completed", {"result": _preview(last_state)})
             return last_state
         except Exception as e:
             await self.log_step(run_id, "Workflow Error", "failed", {"error": str(e)})
             raise e
 
+    def _run_cache_key(self, input_data: Any) -> Optional[str]:
+        """Key for runs of this agent with this input, or None if they should not be cached."""
+        if not self.cache_runs or not self.run_cache.enabled:
+            return None
+        try:
+            payload = orjson.dumps(
+                input_data, default=json_default, option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS
+            )
+        except TypeError:
+            return None
+        return f"{type(self).__name__}-{hashlib.sha1(payload).hexdigest()}"
+
     def build_graph(self) -> StateGraph:
         """
         Subclasses must implement this to return a compiled LangGraph.
@@ -1,8 +1,29 @@
 import logging
 import os
 import sys
+import time
 from typing import Any, Dict
 
+class _CachedTimeFormatter(logging.Formatter):
+    """
+    Formatter that reuses the formatted date-time within the same second.
+    Output is the same as logging.Formatter's default asctime, but localtime() and
+    strftime() run once per second instead of once per record (e.g. per access log line).
+    """
+
+    def __init__(self, fmt: str):
+        super().__init__(fmt)
+        self._last_second = -1
+        self._last_formatted = ""
+
+    def formatTime(self, record: logging.LogRecord, datefmt: str = None) -> str:
+        second = int(record.created)
+        if second != self._last_second:
+            self._last_formatted = time.strftime(self.default_time_format, self.converter(second))
+            self._last_second = second
+        return self.default_msec_format % (self._last_formatted, record.msecs)
+
+
 def setup_logging():
     """
     Configures the Global Logging State.
@@ -13,7 +34,7 @@ def setup_logging():
 
     # Standard format
     log_format = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
-    formatter = logging.Formatter(log_format)
+    formatter = _CachedTimeFormatter(log_format)
 
     # Handler that writes to stderr (standard for containerized apps)
     handler = logging.StreamHandler(sys.stderr)
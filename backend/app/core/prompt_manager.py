@@ -1,5 +1,6 @@
 import os
-from jinja2 import Environment, FileSystemLoader, select_autoescape
+from typing import Dict
+from jinja2 import Environment, FileSystemLoader, Template, select_autoescape
 
 class PromptManager:
     def __init__(self, templates_dir: str = None):
@@ -8,10 +9,13 @@ class PromptManager:
             current_dir = os.path.dirname(os.path.abspath(__file__))
             templates_dir = os.path.join(current_dir, "..", "..", "prompts")
         
+        # Prompts ship with the code, so skip Jinja's per-render mtime check
         self.env = Environment(
             loader=FileSystemLoader(templates_dir),
-            autoescape=select_autoescape()
+            autoescape=select_autoescape(),
+            auto_reload=False
         )
+        self._templates: Dict[str, Template] = {}
 
     def render_prompt(self, template_path: str, **kwargs) -> str:
         """
@@ -21,7 +25,9 @@ class PromptManager:
             template_path: Path to the template relative to templates_dir
             **kwargs: Arguments to pass to the template
         """
-        template = self.env.get_template(template_path)
+        template = self._templates.get(template_path)
+        if template is None:
+            template = self._templates[template_path] = self.env.get_template(template_path)
         return template.render(**kwargs)
 
 # Global instance for easy use
@@ -1,4 +1,6 @@
 
+import datetime
+import time
 import numpy as np
 import math
 from typing import Any
@@ -12,25 +14,118 @@ def sanitize_numpy(data: Any) -> Any:
     - numpy.floating -> float
     - numpy.ndarray -> list
     - NaN / Infinity -> None
+
+    Containers are only copied when something inside them changes, so already
+    clean subtrees are returned as-is instead of being rebuilt.
     """
+    # Exact built-in types (nearly every value) are dispatched with one dict lookup
+    sanitizer = _SANITIZERS.get(type(data))
+    if sanitizer is not None:
+        return sanitizer(data)
+
+    # Subclasses and numpy scalars (np.float64 subclasses float, so check numpy first)
     if isinstance(data, dict):
-        return {k: sanitize_numpy(v) for k, v in data.items()}
+        return _sanitize_dict(data)
     elif isinstance(data, list):
-        return [sanitize_numpy(v) for v in data]
-    elif isinstance(data, (np.integer, np.int64, np.int32)):
+        return _sanitize_list(data)
+    elif isinstance(data, np.integer):
         return int(data)
-    elif isinstance(data, (np.floating, np.float64, np.float32)):
-        val = float(data)
-        if math.isnan(val) or math.isinf(val):
-            return None
-        return val
+    elif isinstance(data, np.floating):
+        return _sanitize_float(float(data))
     elif isinstance(data, float):
-        if math.isnan(data) or math.isinf(data):
-            return None
-        return data
+        return _sanitize_float(data)
     elif isinstance(data, np.ndarray):
-        return sanitize_numpy(data.tolist())
-    elif isinstance(data, (np.bool_, bool)):
+        return _sanitize_array(data)
+    elif isinstance(data, np.bool_):
         return bool(data)
     else:
         return data
+
+
+def _sanitize_dict(data: dict) -> dict:
+    result = None
+    for k, v in data.items():
+        clean = sanitize_numpy(v)
+        if clean is not v:
+            if result is None:
+                result = dict(data)
+            result[k] = clean
+    return data if result is None else result
+
+
+def _sanitize_list(data: list) -> list:
+    result = None
+    for i, v in enumerate(data):
+        clean = sanitize_numpy(v)
+        if clean is not v:
+            if result is None:
+                result = list(data)
+            result[i] = clean
+    return data if result is None else result
+
+
+def _sanitize_float(data: float) -> Any:
+    return data if math.isfinite(data) else None
+
+
+def _sanitize_array(arr: np.ndarray) -> list:
+    """Convert an array to (nested) lists, scrubbing non-finite floats in NumPy rather than per element."""
+    kind = arr.dtype.kind
+    if kind == "f":
+        # One vectorized isfinite pass; casting to object yields Python floats and None
+        return np.where(np.isfinite(arr), arr, None).tolist()
+    if kind in "iub":
+        # Integers and booleans cannot be NaN and tolist() already yields Python scalars
+        return arr.tolist()
+    return sanitize_numpy(arr.tolist())
+
+
+def _unchanged(data: Any) -> Any:
+    return data
+
+
+_SANITIZERS = {
+    str: _unchanged,
+    int: _unchanged,
+    bool: _unchanged,
+    type(None): _unchanged,
+    dict: _sanitize_dict,
+    list: _sanitize_list,
+    float: _sanitize_float,
+    np.ndarray: _sanitize_array,
+}
+
+
+def json_default(obj: Any) -> Any:
+    """
+    `default` hook for orjson.dumps, for values orjson does not serialize natively.
+
+    Converts:
+    - datetime subclasses (e.g. Firestore timestamps) -> ISO 8601 string
+    - numpy scalars -> Python scalars (non-finite floats end up as null)
+    """
+    if isinstance(obj, (datetime.datetime, datetime.date)):
+        return obj.isoformat()
+    if isinstance(obj, np.generic):
+        return obj.item()
+    raise TypeError(f"Type is not JSON serializable: {type(obj).__name__}")
+
+
+# Formatted date-time of the last second seen by utc_now_iso
+_last_second = -1
+_last_second_prefix = ""
+
+
+def utc_now_iso() -> str:
+    """
+    Current UTC time in ISO 8601, like datetime.now(timezone.utc).isoformat().
+
+    Formatting the date-time is reused within the same second, which makes this
+    much cheaper on hot paths such as per-step logging. Microseconds are always included.
+    """
+    global _last_second, _last_second_prefix
+    second, nanos = divmod(time.time_ns(), 1_000_000_000)
+    if second != _last_second:
+        _last_second_prefix = datetime.datetime.fromtimestamp(second, datetime.timezone.utc).strftime("%Y-%m-%dT%H:%M:%S")
+        _last_second = second
+    return f"{_last_second_prefix}.{nanos // 1000:06d}+00:00"
@@ -1,6 +1,9 @@
 from typing import Optional
 from app.services.auth_service import AuthService, User
 
+# Built once: User is a validated pydantic model and the mock always returns the same user
+_MOCK_USER = User(username="mock-user-123", email="mock@example.com", full_name="Mock User")
+
 class MockAuthService(AuthService):
     async def get_current_user(self, token: Optional[str] = None) -> User:
-        return User(id="mock-user-123", email="mock@example.com", name="Mock User")
+        return _MOCK_USER
@@ -1,26 +1,28 @@
 import logging
-import os
+from app.core.logging import setup_logging
 from app.services.logger_service import LoggerService
 
 class StdLogger(LoggerService):
     def __init__(self):
-        log_level_str = os.getenv("LOG_LEVEL", "DEBUG").upper()
-        log_level = getattr(logging, log_level_str, logging.DEBUG)
-        logging.basicConfig(
-            level=log_level,
-            format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-        )
         self.logger = logging.getLogger("advisor")
-        self.logger.setLevel(log_level)
+        # Handlers, format and level come from setup_logging (run at app startup).
+        # Only configure here when nothing did yet, e.g. in scripts and tests.
+        if not self.logger.handlers:
+            setup_logging()
 
+    # Most calls pass no kwargs; only hand logging an `extra` mapping when there is one
     def info(self, message: str, **kwargs):
-        self.logger.info(message, extra=kwargs)
+        self.logger.info(message, extra=kwargs or None)
 
     def error(self, message: str, **kwargs):
-        self.logger.error(message, extra=kwargs)
+        self.logger.error(message, extra=kwargs or None)
+
+    def exception(self, message: str, **kwargs):
+        # The traceback is only formatted if a handler emits the record
+        self.logger.exception(message, extra=kwargs or None)
 
     def warning(self, message: str, **kwargs):
-        self.logger.warning(message, extra=kwargs)
+        self.logger.warning(message, extra=kwargs or None)
 
     def debug(self, message: str, **kwargs):
-        self.logger.debug(message, extra=kwargs)
+        self.logger.debug(message, extra=kwargs or None)
@@ -1,52 +1,263 @@
+import asyncio
+import copy
+import itertools
 import os
+import weakref
+from google.api_core.exceptions import AlreadyExists, NotFound
 from google.cloud import firestore
 from google.cloud.firestore import FieldFilter
-from typing import Dict, Any, Optional, List
+from typing import AsyncIterator, Dict, Any, Iterable, Optional, List, Tuple, Union
 from app.services.storage_service import StorageService
 from app.services.logger_service import LoggerService
 from app.infrastructure.logging.std_logger import StdLogger
+from app.core.cache import TTLCache
+
+# Firestore rejects batches with more than 500 writes
+MAX_BATCH_SIZE = 500
+
+# Each client owns one gRPC channel, which caps the number of concurrent streams
+# (around 100 per HTTP/2 connection). Calls are spread round-robin over a pool of clients.
+CHANNEL_POOL_SIZE = max(1, int(os.getenv("FIRESTORE_CHANNEL_POOL", str(min(8, os.cpu_count() or 1)))))
+
+# Opt-in: cache reads in-process for this many seconds. Writes from this process invalidate
+# the cache; writes from other workers only become visible once the entry expires, so with
+# several workers pollers may see stale runs, jobs or plans. Missing documents are not cached.
+# 0 (default) disables it.
+READ_CACHE_TTL_SECONDS = float(os.getenv("FIRESTORE_READ_CACHE_TTL_SECONDS", "0"))
 
 class FirestoreStorage(StorageService):
+    """
+    Firestore-backed storage.
+
+    Uses the native asyncio client, so RPCs are awaited directly on the event loop
+    and concurrent calls are multiplexed over a small pool of gRPC channels.
+    """
+
+    # Clients shared by all instances: creating one sets up a gRPC channel and credentials.
+    # An async client is bound to the event loop it first runs on, so they are kept per loop.
+    _clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Dict[str, List[firestore.AsyncClient]]]" = (
+        weakref.WeakKeyDictionary()
+    )
+    _next_client = itertools.count()
+
+    # Read caches shared by all instances, so a write through any of them invalidates them
+    _doc_cache = TTLCache(maxsize=10_000, ttl=READ_CACHE_TTL_SECONDS)
+    # One cache per (project, collection), so a write drops every cached query on that collection
+    _list_cache: Dict[Tuple[str, str], TTLCache] = {}
+    # Bumped by every write to a (project, collection); reads that overlap a write are not cached
+    _generations: Dict[Tuple[str, str], int] = {}
+
     def __init__(self, logger: Optional[LoggerService] = None):
-        project_id = os.getenv("GCP_PROJECT_ID", "local-project")
-        self.db = firestore.Client(project=project_id)
+        self.project_id = os.getenv("GCP_PROJECT_ID", "local-project")
         self.logger = logger or StdLogger()
 
+    @property
+    def db(self) -> firestore.AsyncClient:
+        clients = self._clients.setdefault(asyncio.get_running_loop(), {})
+        pool = clients.get(self.project_id)
+        if pool is None:
+            # Channels are opened lazily on each client's first call
+            pool = clients[self.project_id] = [
+                firestore.AsyncClient(project=self.project_id) for _ in range(CHANNEL_POOL_SIZE)
+            ]
+        return pool[next(self._next_client) % len(pool)]
+
+    @classmethod
+    async def close_clients(cls) -> None:
+        """Close the gRPC channels of the clients opened on the running loop."""
+        clients = cls._clients.pop(asyncio.get_running_loop(), {})
+        for client in itertools.chain.from_iterable(clients.values()):
+            # AsyncClient has no close(); the channel is owned by its transport,
+            # which only exists once the client has made its first call
+            transport = getattr(client, "_transport", None)
+            if transport is not None:
+                await transport.close()
+
     async def save(self, collection: str, id: str, data: Dict[str, Any]) -> str:
         self.logger.debug(f"Firestore Save: {collection}/{id}")
-        doc_ref = self.db.collection(collection).document(id)
-        doc_ref.set(data)
+        try:
+            await self.db.collection(collection).document(id).set(data)
+        finally:
+            self._invalidate(collection, [id])
         return id
 
+    async def create(self, collection: str, id: str, data: Dict[str, Any]) -> bool:
+        self.logger.debug(f"Firestore Create: {collection}/{id}")
+        try:
+            await self.db.collection(collection).document(id).create(data)
+        except AlreadyExists:
+            return False
+        finally:
+            self._invalidate(collection, [id])
+        return True
+
     async def get(self, collection: str, id: str) -> Optional[Dict[str, Any]]:
+        key = (self.project_id, collection, id)
+        cached = self._doc_cache.get(key)
+        if cached is not None:
+            return copy.deepcopy(cached)
         self.logger.debug(f"Firestore Get: {collection}/{id}")
-        doc_ref = self.db.collection(collection).document(id)
-        doc = doc_ref.get()
-        if doc.exists:
-            return doc.to_dict()
-        return None
+        generation = self._generation(collection)
+        doc = await self.db.collection(collection).document(id).get()
+        data = doc.to_dict() if doc.exists else None
+        if data is not None and READ_CACHE_TTL_SECONDS > 0 and generation == self._generation(collection):
+            self._doc_cache.set(key, copy.deepcopy(data), ttl=READ_CACHE_TTL_SECONDS)
+        return data
+
+    async def get_many(self, collection: str, ids: List[str]) -> Dict[str, Dict[str, Any]]:
+        self.logger.debug(f"Firestore Get Many: {collection} ({len(ids)} docs)")
+        if not ids:
+            return {}
+        db = self.db
+        collection_ref = db.collection(collection)
+        # One BatchGetDocuments RPC for all ids
+        return {
+            doc.id: doc.to_dict()
+            async for doc in db.get_all([collection_ref.document(id) for id in ids])
+            if doc.exists
+        }
 
-    async def update(self, collection: str, id: str, data: Dict[str, Any]) -> None:
+    async def update(self, collection: str, id: str, data: Dict[str, Any]) -> bool:
         self.logger.debug(f"Firestore Update: {collection}/{id}")
-        doc_ref = self.db.collection(collection).document(id)
-        doc_ref.update(data)
+        try:
+            await self.db.collection(collection).document(id).update(data)
+        except NotFound:
+            return False
+        finally:
+            self._invalidate(collection, [id])
+        return True
 
     async def delete(self, collection: str, id: str) -> None:
         self.logger.debug(f"Firestore Delete: {collection}/{id}")
-        doc_ref = self.db.collection(collection).document(id)
-        doc_ref.delete()
+        try:
+            await self.db.collection(collection).document(id).delete()
+        finally:
+            self._invalidate(collection, [id])
+
+    async def save_many(self, collection: str, docs: Dict[str, Dict[str, Any]]) -> None:
+        self.logger.debug(f"Firestore Save Many: {collection} ({len(docs)} docs)")
+        db = self.db
+        collection_ref = db.collection(collection)
+        items = list(docs.items())
+        batches = []
+        for start in range(0, len(items), MAX_BATCH_SIZE):
+            batch = db.batch()
+            for id, data in items[start:start + MAX_BATCH_SIZE]:
+                batch.set(collection_ref.document(id), data)
+            batches.append(batch)
+        try:
+            await self._commit_all(batches)
+        finally:
+            self._invalidate(collection, docs)
+
+    async def delete_many(self, collection: str, ids: List[str]) -> None:
+        self.logger.debug(f"Firestore Delete Many: {collection} ({len(ids)} docs)")
+        db = self.db
+        collection_ref = db.collection(collection)
+        batches = []
+        for start in range(0, len(ids), MAX_BATCH_SIZE):
+            batch = db.batch()
+            for id in ids[start:start + MAX_BATCH_SIZE]:
+                batch.delete(collection_ref.document(id))
+            batches.append(batch)
+        try:
+            await self._commit_all(batches)
+        finally:
+            self._invalidate(collection, ids)
+
+    def _invalidate(self, collection: str, ids: Iterable[str]) -> None:
+        # Runs once the write has completed: entries cached while it was in flight may be stale
+        key = (self.project_id, collection)
+        self._generations[key] = self._generations.get(key, 0) + 1
+        for id in ids:
+            self._doc_cache.pop((self.project_id, collection, id))
+        self._list_cache.pop(key, None)
+
+    def _generation(self, collection: str) -> int:
+        return self._generations.get((self.project_id, collection), 0)
+
+    async def _commit_all(self, batches: List[Any]) -> None:
+        # Batches are independent (each is atomic on its own), so commit them concurrently
+        await asyncio.gather(*(batch.commit() for batch in batches))
+
+    async def list(
+        self,
+        collection: str,
+        filters: Optional[Dict[str, Any]] = None,
+        fields: Optional[List[str]] = None,
+    ) -> List[Dict[str, Any]]:
+        try:
+            key = (frozenset(filters.items()) if filters else frozenset(), tuple(fields or ()))
+        except TypeError:
+            # Unhashable filter values are not cached
+            key = None
+        cache = self._list_cache.get((self.project_id, collection))
+        if key is not None and cache is not None:
+            cached = cache.get(key)
+            if cached is not None:
+                return copy.deepcopy(cached)
+
+        generation = self._generation(collection)
+        docs = [doc async for doc in self.stream(collection, filters, fields)]
+        if key is not None and READ_CACHE_TTL_SECONDS > 0 and generation == self._generation(collection):
+            if cache is None:
+                cache = self._list_cache[(self.project_id, collection)] = TTLCache(maxsize=100, ttl=READ_CACHE_TTL_SECONDS)
+            cache.set(key, copy.deepcopy(docs), ttl=READ_CACHE_TTL_SECONDS)
+        return docs
+
+    async def stream(
+        self,
+        collection: str,
+        filters: Optional[Dict[str, Any]] = None,
+        fields: Optional[List[str]] = None,
+    ) -> AsyncIterator[Dict[str, Any]]:
+        self.logger.debug(f"Firestore Stream: {collection} filters={filters} fields={fields}")
+        query = self._query(collection, filters)
+        if fields:
+            # Projection: only the requested fields are sent over the wire
+            query = query.select(fields)
+        # Pages are fetched as the stream advances, so only the current page is held in memory
+        async for doc in query.stream():
+            yield doc.to_dict()
+
+    async def count(self, collection: str, filters: Optional[Dict[str, Any]] = None) -> int:
+        self.logger.debug(f"Firestore Count: {collection} filters={filters}")
+        query = self._query(collection, filters)
+        # Aggregation query: the count is computed server-side, no documents are transferred
+        results = await query.count().get()
+        return int(results[0][0].value)
+
+    async def list_page(
+        self,
+        collection: str,
+        filters: Optional[Dict[str, Any]] = None,
+        order_by: Union[str, List[str], None] = None,
+        descending: bool = False,
+        limit: Optional[int] = None,
+        start_after: Any = None,
+        fields: Optional[List[str]] = None,
+    ) -> List[Dict[str, Any]]:
+        self.logger.debug(f"Firestore List Page: {collection} filters={filters} order_by={order_by} limit={limit}")
+        query = self._query(collection, filters)
+        if fields:
+            # Projection: only the requested fields are sent over the wire
+            query = query.select(fields)
+        if order_by:
+            order_fields = [order_by] if isinstance(order_by, str) else order_by
+            direction = firestore.Query.DESCENDING if descending else firestore.Query.ASCENDING
+            for field in order_fields:
+                query = query.order_by(field, direction=direction)
+            if start_after is not None:
+                start = [start_after] if isinstance(order_by, str) else start_after
+                query = query.start_after(dict(zip(order_fields, start)))
+        if limit is not None:
+            query = query.limit(limit)
+
+        return [doc.to_dict() async for doc in query.stream()]
 
-    async def list(self, collection: str, filters: Optional[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
-        self.logger.debug(f"Firestore List: {collection} filters={filters}")
+    def _query(self, collection: str, filters: Optional[Dict[str, Any]] = None):
         query = self.db.collection(collection)
-        
         if filters:
             for key, value in filters.items():
                 query = query.where(filter=FieldFilter(key, "==", value))
-                
-        docs = query.stream()
-        results = []
-        for doc in docs:
-            data = doc.to_dict()
-            results.append(data)
-        return results
+        return query
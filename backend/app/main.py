@@ -2,6 +2,7 @@ from contextlib import asynccontextmanager
 import os
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 from app.api.news import router as news_router
 from app.api.agents import router as agents_router
 from app.api.portfolio import router as portfolio_router
@@ -11,25 +12,41 @@ from app.api.strategies import router as strategies_router
 from app.api.admin import router as admin_router
 from app.core.logging import setup_logging
 from app.core.dependencies import get_config_service
+from app.infrastructure.storage.firestore_storage import FirestoreStorage
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     setup_logging()
     # Initialize ConfigService (load from Storage/YAML)
-    from app.core.dependencies import get_storage_service
-    storage = get_storage_service()
-    config_service = get_config_service(storage=storage)
+    config_service = await get_config_service()
     await config_service.initialize()
+    # Build (and cache) the OpenAPI schema now rather than on the first /openapi.json or /docs request
+    app.openapi()
     yield
+    await FirestoreStorage.close_clients()
 
-app = FastAPI(title="ETF Portfolio Advisor Backend", lifespan=lifespan)
+# orjson is several times faster than the stdlib encoder on the large nested
+# payloads returned by plans, research and optimization endpoints
+app = FastAPI(
+    title="ETF Portfolio Advisor Backend",
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse,
+)
 
-# CORS Configuration
-origins = os.getenv("CORS_ORIGINS", "http://localhost:8100").split(",")
+# CORS Configuration: a comma-separated list of origins, or "re:<pattern>" for a single
+# compiled regex (e.g. for many subdomains), which is matched in one call per request
+cors_origins = os.getenv("CORS_ORIGINS", "http://localhost:8100").strip()
+if cors_origins.startswith("re:"):
+    origins = []
+    origin_regex = cors_origins[len("re:"):]
+else:
+    origins = [origin.strip() for origin in cors_origins.split(",") if origin.strip()]
+    origin_regex = None
 
 app.add_middleware(
     CORSMiddleware,
     allow_origins=origins,
+    allow_origin_regex=origin_regex,
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
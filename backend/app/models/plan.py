@@ -91,8 +91,30 @@ class Plan(BaseModel):
     # Portfolio Constraints
     constraints: Optional[PortfolioConstraints] = None
 
-    # Research History
+    # Research History (most recent runs; older ones are archived to plans/{plan_id}/research_runs)
     research_history: List[ResearchRun] = []
+    archived_research_runs: int = 0
 
     # User Notes
     notes: Optional[str] = None
+
+
+class PlanSummary(BaseModel):
+    """
+    Lightweight view of a plan for listings.
+
+    Excludes optimization results and research history, which make full plans heavy.
+    """
+    plan_id: str
+    name: str
+    description: Optional[str] = None
+    created_at: datetime
+    updated_at: datetime
+    base_currency: str = "JPY"
+    risk_preference: RiskProfile = RiskProfile.MODERATE
+
+
+class PlanSummaryPage(BaseModel):
+    """A page of plan summaries, most recently updated first"""
+    items: List[PlanSummary]
+    next_cursor: Optional[str] = None  # Opaque position after the last item, pass back as `cursor`
@@ -192,3 +192,7 @@ class BacktestResult(BaseModel):
             }
         }
     )
+
+
+# Resolve the forward reference now, so the first request does not pay for building the validator
+OptimizationResult.model_rebuild()
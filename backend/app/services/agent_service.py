@@ -1,18 +1,30 @@
-from typing import Dict, Any, Type, Optional, List
+from typing import Dict, Any, Callable, Optional, List, AsyncIterator
+import asyncio
 import uuid
-import datetime
 from app.services.logger_service import LoggerService
 from app.services.storage_service import StorageService
 from app.core.agent_base import AgentBase
+from app.core.utils import utc_now_iso
+
+# Builds an agent from the service's logger and storage (an AgentBase subclass, or a partial binding extra services)
+AgentFactory = Callable[[LoggerService, StorageService], AgentBase]
+
+# Run statuses after which no more events are published
+TERMINAL_RUN_STATUSES = ("completed", "failed")
 
 class AgentService:
     def __init__(self, logger: LoggerService, storage: StorageService):
         self.logger = logger
         self.storage = storage
-        self._agents: Dict[str, Type[AgentBase]] = {}
+        self._agents: Dict[str, AgentFactory] = {}
+        # In-process subscribers to run events, keyed by run_id
+        self._subscribers: Dict[str, List[asyncio.Queue]] = {}
+        # How long a stream waits for an event before re-checking storage.
+        # Covers runs executing in another worker process.
+        self.stream_poll_seconds = 15.0
 
-    def register_agent(self, name: str, agent_cls: Type[AgentBase]):
-        self._agents[name] = agent_cls
+    def register_agent(self, name: str, agent_factory: AgentFactory):
+        self._agents[name] = agent_factory
 
     async def create_run(self, agent_name: str, input_data: Any) -> str:
         """
@@ -29,7 +41,7 @@ class AgentService:
             "agent": agent_name,
             "status": "queued",
             "input": input_data,
-            "created_at": datetime.datetime.now(datetime.timezone.utc).isoformat()
+            "created_at": utc_now_iso()
         })
         return run_id
 
@@ -41,30 +53,45 @@ class AgentService:
         
         try:
             # Update status to running
-            await self.storage.update("agent_runs", run_id, {
+            await self._update_run(run_id, {
                 "status": "running",
-                "started_at": datetime.datetime.now(datetime.timezone.utc).isoformat()
+                "started_at": utc_now_iso()
             })
 
             # Instantiate agent for this run
-            agent_cls = self._agents[agent_name]
-            agent = agent_cls(self.logger, self.storage)
+            agent = self._agents[agent_name](self.logger, self.storage)
+            agent.step_listeners.append(
+                lambda step_data: self._publish(run_id, {"type": "log", **step_data})
+            )
 
-            result = await agent.run(run_id, input_data)
+            try:
+                result = await agent.run(run_id, input_data)
+            finally:
+                # Step logs are written behind; store them before the run is marked as done
+                await agent.flush_logs()
             
-            await self.storage.update("agent_runs", run_id, {
+            await self._update_run(run_id, {
                 "status": "completed",
                 "result": result,
-                "completed_at": datetime.datetime.now(datetime.timezone.utc).isoformat()
+                "completed_at": utc_now_iso()
             })
         except Exception as e:
             self.logger.error(f"Agent run failed: {run_id} - {e}")
-            await self.storage.update("agent_runs", run_id, {
+            await self._update_run(run_id, {
                 "status": "failed",
                 "error": str(e),
-                "completed_at": datetime.datetime.now(datetime.timezone.utc).isoformat()
+                "completed_at": utc_now_iso()
             })
 
+    async def _update_run(self, run_id: str, data: Dict[str, Any]):
+        """Persists a run update and notifies stream subscribers."""
+        await self.storage.update("agent_runs", run_id, data)
+        self._publish(run_id, {"type": "status", **data})
+
+    def _publish(self, run_id: str, event: Dict[str, Any]):
+        for queue in self._subscribers.get(run_id, []):
+            queue.put_nowait(event)
+
     async def get_run(self, run_id: str) -> Optional[Dict[str, Any]]:
         return await self.storage.get("agent_runs", run_id)
 
@@ -72,3 +99,39 @@ class AgentService:
         logs = await self.storage.list("agent_logs", filters={"run_id": run_id})
         logs.sort(key=lambda x: x.get("timestamp", ""))
         return logs
+
+    async def stream_run(self, run_id: str) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Yields the current run record, then status and log events as they happen,
+        until the run reaches a terminal status.
+        """
+        queue: asyncio.Queue = asyncio.Queue()
+        # Subscribe before reading the snapshot so no event falls in between
+        self._subscribers.setdefault(run_id, []).append(queue)
+        try:
+            run = await self.get_run(run_id)
+            if run is None:
+                return
+            yield {"type": "status", **run}
+
+            status = run.get("status")
+            while status not in TERMINAL_RUN_STATUSES:
+                try:
+                    event = await asyncio.wait_for(queue.get(), timeout=self.stream_poll_seconds)
+                except asyncio.TimeoutError:
+                    # Nothing published here; the run may be executing in another worker
+                    run = await self.get_run(run_id)
+                    if run is None:
+                        return
+                    if run.get("status") == status:
+                        continue
+                    event = {"type": "status", **run}
+
+                yield event
+                if event["type"] == "status":
+                    status = event.get("status", status)
+        finally:
+            subscribers = self._subscribers.get(run_id, [])
+            subscribers.remove(queue)
+            if not subscribers:
+                self._subscribers.pop(run_id, None)
@@ -37,3 +37,9 @@ class MockUserProvider(UserProvider):
             raise ValueError("User already exists")
         self.db[user.username] = user
         return user
+
+    async def create_user_if_absent(self, user: UserInDB) -> Optional[User]:
+        if user.username in self.db:
+            return None
+        self.db[user.username] = user
+        return user
@@ -1,7 +1,7 @@
 from typing import Optional
-from datetime import datetime
 from app.services.user_provider import UserProvider
 from app.models.auth import User, UserInDB
+from app.core.utils import utc_now_iso
 
 
 class StorageUserProvider(UserProvider):
@@ -23,18 +23,31 @@ class StorageUserProvider(UserProvider):
 
     async def create_user(self, user: UserInDB) -> User:
         """Create a new user in Firestore."""
-        user_data = {
+        user_data = self._to_document(user)
+        await self.storage.save("users", user.username, user_data)
+        return self._to_user(user_data)
+
+    async def create_user_if_absent(self, user: UserInDB) -> Optional[User]:
+        """Create a new user in Firestore in a single write, or return None if the username is taken."""
+        user_data = self._to_document(user)
+        if not await self.storage.create("users", user.username, user_data):
+            return None
+        return self._to_user(user_data)
+
+    @staticmethod
+    def _to_document(user: UserInDB) -> dict:
+        return {
             "username": user.username,
             "hashed_password": user.hashed_password,
             "role": user.role or "user",
             "disabled": user.disabled if user.disabled is not None else False,
-            "created_at": datetime.utcnow().isoformat()
+            "created_at": utc_now_iso()
         }
 
-        await self.storage.save("users", user.username, user_data)
-
+    @staticmethod
+    def _to_user(user_data: dict) -> User:
         return User(
-            username=user.username,
+            username=user_data["username"],
             role=user_data["role"],
             disabled=user_data["disabled"]
         )
@@ -1,18 +1,44 @@
 from datetime import datetime, timedelta, timezone
-from typing import Optional, Union, Any, Dict
-from jose import jwt, JWTError
+from typing import Optional, Union, Any, Dict, List
+from jose import jwk, jwt, JWTError
 from passlib.context import CryptContext
 from fastapi import HTTPException, status, Depends
 from fastapi.security import OAuth2PasswordBearer
+import hashlib
+import hmac
+import logging
 import os
+import time
+import asyncio
 from abc import ABC, abstractmethod
-from app.models.auth import Token, User
+from app.models.auth import Token, User, UserInDB
+from app.core.concurrency import run_limited, password_hash_limiter
+from app.core.cache import TTLCache
+from app.core.batching import AsyncBatcher, BatchWriter
+from app.core.utils import utc_now_iso
 
 # Configuration
 SECRET_KEY = os.getenv("AUTH_SECRET_KEY", "your-secret-key-change-in-production-keep-safe")
 ALGORITHM = "HS256"
 ACCESS_TOKEN_EXPIRE_MINUTES = 30
 REFRESH_TOKEN_EXPIRE_DAYS = 7
+# How long user lookups are reused on the token refresh path
+USER_CACHE_TTL_SECONDS = 30
+USER_CACHE_MAX_SIZE = int(os.getenv("USER_CACHE_MAX_SIZE", "1024"))
+# How long a successful password check is remembered, so repeated logins skip bcrypt.
+# Only successes are cached: wrong passwords always pay the full bcrypt cost. 0 disables it.
+PASSWORD_CACHE_TTL_SECONDS = float(os.getenv("PASSWORD_CACHE_TTL_SECONDS", "120"))
+PASSWORD_CACHE_MAX_SIZE = int(os.getenv("PASSWORD_CACHE_MAX_SIZE", "1024"))
+# Opt-in: answer revocation checks from an in-memory snapshot of the unexpired revocations,
+# reloaded this often. Revocations made by this process are seen at once; those made by
+# other workers once the snapshot is reloaded. Each reload reads the whole revoked_tokens
+# collection, which stays small only with its TTL policy on expires_at (firestore.indexes.json).
+# 0 (default) checks each token against storage with a batched multi-get.
+REVOCATION_SNAPSHOT_TTL_SECONDS = float(os.getenv("REVOCATION_SNAPSHOT_TTL_SECONDS", "0"))
+# After a failed reload, checks go to storage for this long before the snapshot is retried
+REVOCATION_SNAPSHOT_RETRY_SECONDS = 30
+
+logger = logging.getLogger(__name__)
 
 # Password Hashing
 pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
@@ -49,18 +75,72 @@ class AuthService(ABC):
     async def revoke_token(self, token: str) -> None:
         pass
 
+    @abstractmethod
+    async def get_user(self, username: str) -> Optional[UserInDB]:
+        pass
+
+    @abstractmethod
+    def invalidate_user(self, username: str) -> None:
+        pass
+
 class JWTAuthService(AuthService):
     def __init__(self, user_provider: Any, storage_service: Any = None):
         self.user_provider = user_provider
         self.storage_service = storage_service
         self.revoked_collection = "revoked_tokens"
+        # Built once: passing the raw secret makes python-jose construct a new key on every call
+        self._signing_key = jwk.construct(SECRET_KEY, ALGORITHM)
+        # Revocations arriving together (e.g. a logout burst) are stored with one batched write
+        self._revocations = (
+            BatchWriter(storage_service, self.revoked_collection, logger, max_wait_ms=10)
+            if storage_service else None
+        )
+        # Revocation checks from concurrent requests are looked up with one multi-get
+        self._revocation_lookups = AsyncBatcher(self._get_revocations, max_wait_ms=2) if storage_service else None
+        # Revoked token hash -> token expiry (epoch seconds)
+        self._revoked_hashes: Dict[str, float] = {}
+        self._revoked_hashes_expiry = 0.0
+        self._revoked_hashes_retry_at = 0.0
+        self._revoked_hashes_reload: Optional[asyncio.Task] = None
+        self._user_cache = TTLCache(maxsize=USER_CACHE_MAX_SIZE, ttl=USER_CACHE_TTL_SECONDS)
+        self._verified_passwords = TTLCache(maxsize=PASSWORD_CACHE_MAX_SIZE, ttl=PASSWORD_CACHE_TTL_SECONDS)
+        # Keys are keyed hashes, so the cache holds nothing that can be checked against a password offline
+        self._password_cache_secret = os.urandom(32)
+
+    async def get_user(self, username: str) -> Optional[UserInDB]:
+        """
+        Look up a user through the provider, reusing hits for USER_CACHE_TTL_SECONDS.
+        Misses are not cached so newly registered users are visible immediately.
+        """
+        cached = self._user_cache.get(username)
+        if cached is not None:
+            return cached
+
+        user = await self.user_provider.get_user_by_username(username)
+        if user:
+            self._user_cache.set(username, user)
+        return user
+
+    def invalidate_user(self, username: str) -> None:
+        """Drop a cached user lookup, e.g. after the user was created or changed."""
+        self._user_cache.pop(username)
 
     async def authenticate_user(self, username: str, password: str) -> Optional[User]:
         user = await self.user_provider.get_user_by_username(username)
         if not user:
             return None
-        if not self.verify_password(password, user.hashed_password):
-            return None
+        # The stored hash is part of the key, so changing the password invalidates the entry
+        cache_key = hmac.new(
+            self._password_cache_secret,
+            f"{username}\0{user.hashed_password}\0{password}".encode(),
+            hashlib.sha256
+        ).digest()
+        if not self._verified_passwords.get(cache_key):
+            # bcrypt verification is CPU-bound, run it in a worker thread capped by password_hash_limiter
+            if not await run_limited(password_hash_limiter, self.verify_password, password, user.hashed_password):
+                return None
+            if PASSWORD_CACHE_TTL_SECONDS > 0:
+                self._verified_passwords.set(cache_key, True)
         return User(username=user.username, role=user.role, email=user.email, full_name=user.full_name)
 
     def verify_password(self, plain_password: str, hashed_password: str) -> bool:
@@ -77,19 +157,19 @@ class JWTAuthService(AuthService):
             expire = datetime.now(timezone.utc) + timedelta(minutes=ACCESS_TOKEN_EXPIRE_MINUTES)
         
         to_encode.update({"exp": expire, "type": "access"})
-        encoded_jwt = jwt.encode(to_encode, SECRET_KEY, algorithm=ALGORITHM)
+        encoded_jwt = jwt.encode(to_encode, self._signing_key, algorithm=ALGORITHM)
         return encoded_jwt
 
     def create_refresh_token(self, data: dict) -> str:
         to_encode = data.copy()
         expire = datetime.now(timezone.utc) + timedelta(days=REFRESH_TOKEN_EXPIRE_DAYS)
         to_encode.update({"exp": expire, "type": "refresh"})
-        encoded_jwt = jwt.encode(to_encode, SECRET_KEY, algorithm=ALGORITHM)
+        encoded_jwt = jwt.encode(to_encode, self._signing_key, algorithm=ALGORITHM)
         return encoded_jwt
         
     def verify_token(self, token: str, credential_exception: Any) -> Dict[str, Any]:
         try:
-            payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
+            payload = jwt.decode(token, self._signing_key, algorithms=[ALGORITHM])
             
             # Check revocation for refresh tokens if storage is available
             if payload.get("type") == "refresh" and self.storage_service:
@@ -111,27 +191,28 @@ class JWTAuthService(AuthService):
             raise credential_exception
 
     async def revoke_token(self, token: str) -> None:
-        if not self.storage_service:
-            # If no storage, we can't revoke. 
-            pass
-            
+        if not self._revocations:
+            # If no storage, we can't revoke.
+            return
+
         try:
-            payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
+            payload = jwt.decode(token, self._signing_key, algorithms=[ALGORITHM])
             # Use 'jti' if available, otherwise use signature or whole token as ID
             # Ideally we should have added 'jti' to tokens. 
             # For now let's use the token string hash or just the token itself if short enough? 
             # Tokens are long. Let's use a hash of the token.
-            import hashlib
             token_hash = hashlib.sha256(token.encode()).hexdigest()
             
             expiration = payload.get("exp")
             if expiration:
-                exp_time = datetime.fromtimestamp(expiration)
-                # We only need to store it until it expires naturally
-                await self.storage_service.save(self.revoked_collection, token_hash, {
+                if REVOCATION_SNAPSHOT_TTL_SECONDS > 0:
+                    self._revoked_hashes[token_hash] = float(expiration)
+                # We only need to store it until it expires naturally: expires_at is stored
+                # as a timestamp so the collection's TTL policy deletes it afterwards
+                await self._revocations.write(token_hash, {
                     "token_hash": token_hash,
-                    "revoked_at": datetime.now(timezone.utc).isoformat(),
-                    "expires_at": exp_time.isoformat()
+                    "revoked_at": utc_now_iso(),
+                    "expires_at": datetime.fromtimestamp(expiration, timezone.utc)
                 })
         except Exception:
             pass
@@ -141,9 +222,52 @@ class JWTAuthService(AuthService):
             return False
             
         try:
-            import hashlib
             token_hash = hashlib.sha256(token.encode()).hexdigest()
-            data = await self.storage_service.get(self.revoked_collection, token_hash)
+            if REVOCATION_SNAPSHOT_TTL_SECONDS > 0 and await self._refresh_revoked_hashes():
+                # Revocations are never undone, so a fresh snapshot answers both ways without I/O
+                return token_hash in self._revoked_hashes
+            data = await self._revocation_lookups.load(token_hash)
             return data is not None
         except Exception:
             return False
+
+    async def _refresh_revoked_hashes(self) -> bool:
+        """Reload the revocation snapshot if it is stale. Returns whether it is fresh."""
+        now = time.monotonic()
+        if now < self._revoked_hashes_expiry:
+            return True
+        if now < self._revoked_hashes_retry_at:
+            return False
+        # Concurrent checks share a single reload
+        if self._revoked_hashes_reload is None:
+            self._revoked_hashes_reload = asyncio.create_task(self._reload_revoked_hashes())
+        return await asyncio.shield(self._revoked_hashes_reload)
+
+    async def _reload_revoked_hashes(self) -> bool:
+        try:
+            now = time.time()
+            loaded = {}
+            async for item in self.storage_service.stream(
+                self.revoked_collection, fields=["token_hash", "expires_at"]
+            ):
+                expires_at = item.get("expires_at")
+                # Older entries stored expires_at as a naive local ISO string
+                if isinstance(expires_at, str):
+                    expires_at = datetime.fromisoformat(expires_at)
+                if expires_at is not None and expires_at.timestamp() > now:
+                    loaded[item["token_hash"]] = expires_at.timestamp()
+            # Keep revocations made while the reload was running, and drop expired tokens,
+            # which fail JWT validation anyway
+            merged = {**self._revoked_hashes, **loaded}
+            self._revoked_hashes = {token_hash: exp for token_hash, exp in merged.items() if exp > now}
+            self._revoked_hashes_expiry = time.monotonic() + REVOCATION_SNAPSHOT_TTL_SECONDS
+            return True
+        except Exception as e:
+            logger.warning(f"Could not load revoked tokens, checking them one by one: {e}")
+            self._revoked_hashes_retry_at = time.monotonic() + REVOCATION_SNAPSHOT_RETRY_SECONDS
+            return False
+        finally:
+            self._revoked_hashes_reload = None
+
+    async def _get_revocations(self, token_hashes: List[str]) -> Dict[str, Dict[str, Any]]:
+        return await self.storage_service.get_many(self.revoked_collection, token_hashes)
@@ -1,4 +1,4 @@
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple
 import yaml
 import asyncio
 from pathlib import Path
@@ -33,6 +33,11 @@ class ConfigService:
         self.storage = storage_service
         self._etf_config = None
         self._forecasting_config = None
+        # Parsed ETF list, rebuilt when the ETF config changes
+        self._etfs: Optional[List[ETFConfig]] = None
+        self._etfs_by_symbol: Optional[Dict[str, ETFConfig]] = None
+        # (strategies_config.yaml mtime, parsed tax tables)
+        self._tax_tables: Optional[Tuple[Optional[float], Any]] = None
         self._initialized = False
 
     async def initialize(self):
@@ -69,6 +74,8 @@ class ConfigService:
             self._forecasting_config = forecasting_yaml
             print("ConfigService running in YAML-only mode (No Storage)")
         
+        self._etfs = None
+        self._etfs_by_symbol = None
         self._initialized = True
 
     def _load_yaml(self, path: Path) -> Dict[str, Any]:
@@ -93,6 +100,8 @@ class ConfigService:
     async def update_etf_config(self, new_config: Dict[str, Any]):
         """Update ETF config and persist to storage."""
         self._etf_config = new_config
+        self._etfs = None
+        self._etfs_by_symbol = None
         if self.storage:
             await self.storage.update("config", "etfs", new_config)
 
@@ -117,6 +126,8 @@ class ConfigService:
         
         # Update in-memory config
         self._etf_config = etf_yaml
+        self._etfs = None
+        self._etfs_by_symbol = None
         self._forecasting_config = forecasting_yaml
         
         # Persist to storage
@@ -128,6 +139,23 @@ class ConfigService:
 
     def get_all_etfs(self) -> List[ETFConfig]:
         """Get all ETF configurations."""
+        # Copy so callers can't reorder or extend the cached list
+        return list(self._get_etfs())
+
+    def _get_etfs(self) -> List[ETFConfig]:
+        """Parsed ETF list, cached once initialized. Shared, must not be mutated."""
+        if self._etfs is not None:
+            return self._etfs
+        etfs = self._parse_etfs()
+        if self._initialized:
+            # Before initialization the config is re-read from YAML on every call, so don't pin it
+            self._etfs = etfs
+            self._etfs_by_symbol = {}
+            for etf in etfs:
+                self._etfs_by_symbol.setdefault(etf.symbol, etf)
+        return etfs
+
+    def _parse_etfs(self) -> List[ETFConfig]:
         try:
             config = self._get_etf_config()
             if not config or not isinstance(config, dict):
@@ -144,19 +172,22 @@ class ConfigService:
 
     def get_all_symbols(self) -> List[str]:
         """Get all ETF symbols."""
-        return [etf.symbol for etf in self.get_all_etfs()]
+        return [etf.symbol for etf in self._get_etfs()]
 
     def get_etfs_by_asset_class(self, asset_class: str) -> List[ETFConfig]:
         """Get ETFs filtered by asset class."""
-        return [etf for etf in self.get_all_etfs() if etf.asset_class == asset_class]
+        return [etf for etf in self._get_etfs() if etf.asset_class == asset_class]
 
     def get_etfs_by_market(self, market: str) -> List[ETFConfig]:
         """Get ETFs filtered by market (US, JP)."""
-        return [etf for etf in self.get_all_etfs() if etf.market == market]
+        return [etf for etf in self._get_etfs() if etf.market == market]
 
     def get_etf_info(self, symbol: str) -> Optional[ETFConfig]:
         """Get info for a specific ETF symbol."""
-        for etf in self.get_all_etfs():
+        etfs = self._get_etfs()
+        if self._etfs_by_symbol is not None:
+            return self._etfs_by_symbol.get(symbol)
+        for etf in etfs:
             if etf.symbol == symbol:
                 return etf
         return None
@@ -182,23 +213,48 @@ class ConfigService:
         })
 
     def get_tax_settings(self) -> Dict[str, Any]:
-        """Get tax settings for backtesting and optimization."""
-        # Load from strategies_config.yaml
+        """Get tax settings for backtesting and optimization. Shared, must not be mutated."""
+        return self._get_tax_tables()[0]
+
+    def _get_tax_tables(self) -> Tuple[Dict[str, Any], Dict[str, Tuple[float, float]], Tuple[float, float]]:
+        """
+        Tax settings from strategies_config.yaml, plus (short-term, long-term) capital gains
+        rates per account type and the default rates. Re-read only when the file changes.
+        """
         strategies_config_path = self.config_dir / "strategies_config.yaml"
         try:
+            mtime = strategies_config_path.stat().st_mtime
+        except FileNotFoundError:
+            mtime = None
+        if self._tax_tables is not None and self._tax_tables[0] == mtime:
+            return self._tax_tables[1]
+
+        default_settings = {
+            "short_term_capital_gains_rate": 0.35,
+            "long_term_capital_gains_rate": 0.15,
+            "account_types": {}
+        }
+        if mtime is None:
+            tax_settings = default_settings
+        else:
             with open(strategies_config_path, 'r') as f:
                 strategies_config = yaml.safe_load(f)
-                return strategies_config.get('tax_settings', {
-                    "short_term_capital_gains_rate": 0.35,
-                    "long_term_capital_gains_rate": 0.15,
-                    "account_types": {}
-                })
-        except FileNotFoundError:
-            return {
-                "short_term_capital_gains_rate": 0.35,
-                "long_term_capital_gains_rate": 0.15,
-                "account_types": {}
-            }
+            tax_settings = strategies_config.get('tax_settings', default_settings)
+
+        default_rates = (
+            tax_settings.get('short_term_capital_gains_rate', 0.35),
+            tax_settings.get('long_term_capital_gains_rate', 0.15)
+        )
+        account_rates = {
+            account_type: (
+                rates.get('short_term_capital_gains_rate', default_rates[0]),
+                rates.get('long_term_capital_gains_rate', default_rates[1])
+            )
+            for account_type, rates in tax_settings.get('account_types', {}).items()
+        }
+        tables = (tax_settings, account_rates, default_rates)
+        self._tax_tables = (mtime, tables)
+        return tables
 
     def get_tax_rate_for_account(self, account_type: str, holding_period_days: int = 365) -> float:
         """
@@ -211,18 +267,8 @@ class ConfigService:
         Returns:
             Tax rate (e.g., 0.15 for 15%)
         """
-        tax_settings = self.get_tax_settings()
-
-        # Get account-specific rates
-        if account_type in tax_settings.get('account_types', {}):
-            account_rates = tax_settings['account_types'][account_type]
-            short_term_rate = account_rates.get('short_term_capital_gains_rate',
-                tax_settings.get('short_term_capital_gains_rate', 0.35))
-            long_term_rate = account_rates.get('long_term_capital_gains_rate',
-                tax_settings.get('long_term_capital_gains_rate', 0.15))
-        else:
-            short_term_rate = tax_settings.get('short_term_capital_gains_rate', 0.35)
-            long_term_rate = tax_settings.get('long_term_capital_gains_rate', 0.15)
+        _, account_rates, default_rates = self._get_tax_tables()
+        short_term_rate, long_term_rate = account_rates.get(account_type, default_rates)
 
         # Determine if short-term or long-term
         if holding_period_days >= 365:
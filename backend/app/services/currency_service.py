@@ -8,12 +8,15 @@ This service is responsible for:
 4. Calculating FX returns for risk modeling
 """
 
+import asyncio
 import pandas as pd
-from typing import Dict, Any, Optional, List, Tuple
+from typing import Dict, Any, Iterable, Optional, List, Tuple
 from datetime import datetime, timedelta, timezone
 from app.services.storage_service import StorageService
 from app.services.logger_service import LoggerService
 from app.services.currency.currency_provider import CurrencyProvider
+from app.core.batching import AsyncBatcher
+from app.core.cache import TTLCache
 
 
 class CurrencyService:
@@ -41,6 +44,10 @@ class CurrencyService:
         self.provider = provider
         self.collection = "fx_cache"
         self.cache_ttl_hours = 24
+        # In-process layer in front of the storage cache, so hot pairs skip the storage read
+        self._rate_cache = TTLCache(maxsize=256, ttl=60)
+        # Coalesces rate lookups from concurrent requests, so each pair is fetched once per window
+        self._rate_batcher = AsyncBatcher(self._fetch_rates)
 
     async def get_current_rate(self, from_currency: str, to_currency: str) -> float:
         """
@@ -51,17 +58,32 @@ class CurrencyService:
 
         # Check cache first
         cache_key = f"rate_{from_currency}_{to_currency}"
-        cached = await self.storage.get(self.collection, cache_key)
-        if cached:
-            # Check if still valid
-            updated = datetime.fromisoformat(cached["updated_at"])
-            if updated.tzinfo is None:
-                updated = updated.replace(tzinfo=timezone.utc)
-            if datetime.now(timezone.utc) - updated < timedelta(hours=self.cache_ttl_hours):
-                self.logger.debug(f"Using cached FX rate {from_currency}/{to_currency}: {cached['rate']}")
-                return cached["rate"]
+        rate = self._rate_cache.get(cache_key)
+        if rate is not None:
+            return rate
 
-        # Fetch from provider
+        rate = self._fresh_rate(await self.storage.get(self.collection, cache_key))
+        if rate is not None:
+            self.logger.debug(f"Using cached FX rate {from_currency}/{to_currency}: {rate}")
+            self._rate_cache.set(cache_key, rate)
+            return rate
+
+        return await self._fetch_rate(from_currency, to_currency)
+
+    def _fresh_rate(self, cached: Optional[Dict[str, Any]]) -> Optional[float]:
+        """Rate from a storage cache entry, or None if there is none or it expired."""
+        if not cached:
+            return None
+        updated = datetime.fromisoformat(cached["updated_at"])
+        if updated.tzinfo is None:
+            updated = updated.replace(tzinfo=timezone.utc)
+        if datetime.now(timezone.utc) - updated < timedelta(hours=self.cache_ttl_hours):
+            return cached["rate"]
+        return None
+
+    async def _fetch_rate(self, from_currency: str, to_currency: str) -> float:
+        """Fetch a rate from the provider and cache it."""
+        cache_key = f"rate_{from_currency}_{to_currency}"
         try:
             rate = await self.provider.get_current_rate(from_currency, to_currency)
 
@@ -72,12 +94,51 @@ class CurrencyService:
                 {"rate": rate, "updated_at": datetime.now(timezone.utc).isoformat()}
             )
 
+            self._rate_cache.set(cache_key, rate)
+
             self.logger.info(f"Fetched FX rate {from_currency}/{to_currency}: {rate}")
             return rate
         except Exception as e:
             self.logger.error(f"Error fetching FX rate {from_currency}/{to_currency}: {e}")
             raise ValueError(f"Failed to fetch FX rate for {from_currency}/{to_currency}: {e}")
 
+    async def get_current_rates(self, from_currencies: Iterable[str], to_currency: str) -> Dict[str, float]:
+        """
+        Get current exchange rates from each currency to `to_currency`.
+        Lookups are shared with concurrent requests for the same pairs.
+
+        Raises:
+            ValueError: If any of the rates cannot be fetched, like get_current_rate
+        """
+        rates = await self._rate_batcher.load_many((from_currency, to_currency) for from_currency in from_currencies)
+        return {from_currency: rate for (from_currency, _), rate in rates.items()}
+
+    async def _fetch_rates(self, pairs: List[Tuple[str, str]]) -> Dict[Tuple[str, str], Any]:
+        rates: Dict[Tuple[str, str], Any] = {}
+        cache_keys: Dict[Tuple[str, str], str] = {}
+        for from_currency, to_currency in pairs:
+            cache_key = f"rate_{from_currency}_{to_currency}"
+            rate = 1.0 if from_currency == to_currency else self._rate_cache.get(cache_key)
+            if rate is not None:
+                rates[(from_currency, to_currency)] = rate
+            else:
+                cache_keys[(from_currency, to_currency)] = cache_key
+
+        # One storage read for all the pairs not cached in-process
+        stored = await self.storage.get_many(self.collection, list(cache_keys.values())) if cache_keys else {}
+        to_fetch = []
+        for pair, cache_key in cache_keys.items():
+            rate = self._fresh_rate(stored.get(cache_key))
+            if rate is not None:
+                self._rate_cache.set(cache_key, rate)
+                rates[pair] = rate
+            else:
+                to_fetch.append(pair)
+
+        fetched = await asyncio.gather(*(self._fetch_rate(*pair) for pair in to_fetch), return_exceptions=True)
+        rates.update(zip(to_fetch, fetched))
+        return rates
+
     async def get_historical_rates(
         self,
         from_currency: str,
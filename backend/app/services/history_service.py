@@ -1,3 +1,4 @@
+import asyncio
 import datetime
 import pandas as pd
 import numpy as np
@@ -6,6 +7,7 @@ from .storage_service import StorageService
 from .logger_service import LoggerService
 from .history.history_provider import HistoryDataProvider
 from typing import List, Dict, Any, Optional
+from app.core.batching import AsyncBatcher
 
 # Import pandas-ta for technical indicators
 try:
@@ -22,6 +24,8 @@ class HistoryService:
         self.ttl_hours = ttl_hours
         self.collection = "cache"
         self.doc_id_prefix = "history_"
+        # Coalesces latest-price lookups from concurrent requests into one provider call
+        self._price_batcher = AsyncBatcher(self._fetch_latest_prices)
 
     async def get_historical_data(self, tickers: List[str], period: str = "1y", interval: str = "1d") -> Dict[str, Any]:
         """
@@ -31,10 +35,11 @@ class HistoryService:
         results = {}
         tickers_to_fetch = []
 
-        # 1. Check cache for each ticker
+        # 1. Check cache for each ticker (all cache documents are read in one call)
+        doc_ids = {ticker: f"{self.doc_id_prefix}{ticker}_{period}_{interval}" for ticker in tickers}
+        cached_docs = await self.storage.get_many(self.collection, list(doc_ids.values()))
         for ticker in tickers:
-            doc_id = f"{self.doc_id_prefix}{ticker}_{period}_{interval}"
-            cached_data = await self.storage.get(self.collection, doc_id)
+            cached_data = cached_docs.get(doc_ids[ticker])
 
             if cached_data:
                 last_updated_str = cached_data.get("updated_at")
@@ -69,7 +74,12 @@ class HistoryService:
         # 2. Fetch missing data from provider
         if tickers_to_fetch:
             self.logger.info(f"Fetching data from provider for {len(tickers_to_fetch)} tickers: {tickers_to_fetch}")
-            data = self.provider.download_data(tickers_to_fetch, period=period, interval=interval)
+            # Providers are blocking network clients; keep them off the event loop
+            data = await asyncio.to_thread(
+                self.provider.download_data, tickers_to_fetch, period=period, interval=interval
+            )
+            # Cache writes for all fetched tickers go out in one batch
+            cache_entries: Dict[str, Dict[str, Any]] = {}
             
             for ticker in tickers_to_fetch:
                 if data is None:
@@ -173,10 +183,13 @@ class HistoryService:
                         "updated_at": datetime.datetime.now(datetime.timezone.utc).isoformat()
                     }
                     doc_id = f"{self.doc_id_prefix}{ticker}_{period}_{interval}"
-                    await self.storage.save(self.collection, doc_id, cache_entry)
+                    cache_entries[doc_id] = cache_entry
                 else:
                     self.logger.warning(f"No data returned from provider for {ticker}")
 
+            if cache_entries:
+                await self.storage.save_many(self.collection, cache_entries)
+
         return results
 
     async def get_return_metrics(self, tickers: List[str], period: str = "1y") -> Dict[str, Any]:
@@ -242,9 +255,10 @@ class HistoryService:
         tickers_to_fetch = []
 
         # Check cache first
+        doc_ids = {ticker: f"{self.doc_id_prefix}div_{ticker}_{period}" for ticker in tickers}
+        cached_docs = await self.storage.get_many(self.collection, list(doc_ids.values()))
         for ticker in tickers:
-            doc_id = f"{self.doc_id_prefix}div_{ticker}_{period}"
-            cached_data = await self.storage.get(self.collection, doc_id)
+            cached_data = cached_docs.get(doc_ids[ticker])
 
             if cached_data:
                 last_updated_str = cached_data.get("updated_at")
@@ -263,18 +277,21 @@ class HistoryService:
 
         # Fetch from provider
         if tickers_to_fetch:
-            provider_results = self.provider.get_dividends(tickers_to_fetch, period)
+            provider_results = await asyncio.to_thread(self.provider.get_dividends, tickers_to_fetch, period)
+            updated_at = datetime.datetime.now(datetime.timezone.utc).isoformat()
+            cache_entries = {}
             
             for ticker, dividend_data in provider_results.items():
                 results[ticker] = dividend_data
                 
                 # Cache the results
-                cache_entry = {
+                cache_entries[f"{self.doc_id_prefix}div_{ticker}_{period}"] = {
                     "data": dividend_data,
-                    "updated_at": datetime.datetime.now(datetime.timezone.utc).isoformat()
+                    "updated_at": updated_at
                 }
-                doc_id = f"{self.doc_id_prefix}div_{ticker}_{period}"
-                await self.storage.save(self.collection, doc_id, cache_entry)
+
+            if cache_entries:
+                await self.storage.save_many(self.collection, cache_entries)
 
         return results
 
@@ -304,9 +321,10 @@ class HistoryService:
         # Use longer TTL for fundamentals (7 days)
         fundamentals_ttl = self.ttl_hours * 7
 
+        doc_ids = {ticker: f"{self.doc_id_prefix}fund_{ticker}" for ticker in tickers}
+        cached_docs = await self.storage.get_many(self.collection, list(doc_ids.values()))
         for ticker in tickers:
-            doc_id = f"{self.doc_id_prefix}fund_{ticker}"
-            cached_data = await self.storage.get(self.collection, doc_id)
+            cached_data = cached_docs.get(doc_ids[ticker])
 
             if cached_data:
                 last_updated_str = cached_data.get("updated_at")
@@ -325,18 +343,21 @@ class HistoryService:
 
         # Fetch from provider
         if tickers_to_fetch:
-            provider_results = self.provider.get_fundamentals(tickers_to_fetch, fields)
+            provider_results = await asyncio.to_thread(self.provider.get_fundamentals, tickers_to_fetch, fields)
+            updated_at = datetime.datetime.now(datetime.timezone.utc).isoformat()
+            cache_entries = {}
             
             for ticker, fundamental_data in provider_results.items():
                 results[ticker] = fundamental_data
 
                 # Cache the results
-                cache_entry = {
+                cache_entries[f"{self.doc_id_prefix}fund_{ticker}"] = {
                     "data": fundamental_data,
-                    "updated_at": datetime.datetime.now(datetime.timezone.utc).isoformat()
+                    "updated_at": updated_at
                 }
-                doc_id = f"{self.doc_id_prefix}fund_{ticker}"
-                await self.storage.save(self.collection, doc_id, cache_entry)
+
+            if cache_entries:
+                await self.storage.save_many(self.collection, cache_entries)
 
         return results
 
@@ -724,3 +745,12 @@ class HistoryService:
         """
         return self.provider.get_latest_prices(tickers)
 
+    async def get_latest_prices_batched(self, tickers: List[str]) -> Dict[str, float]:
+        """Async get_latest_prices that shares provider calls with concurrent requests."""
+        prices = await self._price_batcher.load_many(tickers)
+        return {ticker: price for ticker, price in prices.items() if price is not None}
+
+    async def _fetch_latest_prices(self, tickers: List[str]) -> Dict[str, float]:
+        # Providers are blocking (yfinance), keep them off the event loop
+        return await asyncio.to_thread(self.get_latest_prices, tickers)
+
@@ -2,7 +2,6 @@ import os
 import hashlib
 import json
 import logging
-import asyncio
 import google.genai as genai
 from openai import OpenAI
 from langchain.chat_models import BaseChatModel
@@ -12,6 +11,7 @@ from abc import ABC, abstractmethod
 from typing import Dict, Any, TypeVar, Optional, List
 from app.services.config_service import ConfigService
 from app.services.storage_service import StorageService
+from app.core.concurrency import run_limited, llm_limiter
 
 logger = logging.getLogger(__name__)
 
@@ -72,10 +72,10 @@ class GeminiProvider(LLMProvider):
         if tools:
             from langchain_google_genai import ChatGoogleGenerativeAI
             llm = ChatGoogleGenerativeAI(client=self.client, model=self.model_name)
-            response = await asyncio.to_thread(run_agent_with_logging, llm=llm, tools=tools, prompt=prompt)
+            response = await run_limited(llm_limiter, run_agent_with_logging, llm=llm, tools=tools, prompt=prompt)
             return response
         else:
-            response = await asyncio.to_thread(self.client.models.generate_content, model=self.model_name, contents=[prompt])
+            response = await run_limited(llm_limiter, self.client.models.generate_content, model=self.model_name, contents=[prompt])
             return response.text
 
 class OpenAIProvider(LLMProvider):
@@ -87,14 +87,14 @@ class OpenAIProvider(LLMProvider):
         if tools:
             from langchain_openai import ChatOpenAI
             llm = ChatOpenAI(client=self.client, model=self.model_name)
-            response = await asyncio.to_thread(run_agent_with_logging, llm=llm, tools=tools, prompt=prompt)
+            response = await run_limited(llm_limiter, run_agent_with_logging, llm=llm, tools=tools, prompt=prompt)
             return response
             # Convert LangChain tools to OpenAI format
             # from langchain_core.utils.function_calling import convert_to_openai_tool
             # openai_tools = [convert_to_openai_tool(t) for t in tools]
             # response = await asyncio.to_thread(self.client.chat.completions.create, model=self.model_name, messages=messages, tools=openai_tools)
         else:
-            response = await asyncio.to_thread(self.client.chat.completions.create, model=self.model_name, messages=[{"role": "user", "content": prompt}])
+            response = await run_limited(llm_limiter, self.client.chat.completions.create, model=self.model_name, messages=[{"role": "user", "content": prompt}])
             return response.choices[0].message.content
 
 class LLMService:
@@ -16,3 +16,7 @@ class LoggerService(ABC):
     @abstractmethod
     def debug(self, message: str, **kwargs):
         pass
+
+    def exception(self, message: str, **kwargs):
+        """Log an error with the current exception's traceback. Call from an except block."""
+        self.error(message, **kwargs)
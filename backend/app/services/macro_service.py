@@ -237,7 +237,8 @@ class MacroService:
         """Fetch data from yfinance."""
         try:
             ticker_obj = yf.Ticker(ticker)
-            hist = ticker_obj.history(period="5d")
+            # Blocking HTTP call; keep it off the event loop
+            hist = await asyncio.to_thread(ticker_obj.history, period="5d")
 
             if hist.empty:
                 return None
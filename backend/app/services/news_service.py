@@ -1,3 +1,4 @@
+import asyncio
 import datetime
 from typing import List, Dict, Any, Optional
 from .news.news_provider import NewsProvider
@@ -12,8 +13,22 @@ class NewsService:
         self.ttl_hours = ttl_hours
         self.collection = "cache"
         self.doc_id = "financial_news"
+        # Lookup shared by all concurrent callers (singleflight)
+        self._inflight: Optional[asyncio.Task] = None
 
     async def get_latest_news(self) -> List[Dict[str, Any]]:
+        # Concurrent requests wait on the same lookup instead of each hitting storage/provider.
+        # Shielded so a cancelled caller does not cancel the lookup for the others.
+        if self._inflight is None:
+            self._inflight = asyncio.create_task(self._fetch_latest_news())
+            self._inflight.add_done_callback(self._clear_inflight)
+        return await asyncio.shield(self._inflight)
+
+    def _clear_inflight(self, task: asyncio.Task):
+        if self._inflight is task:
+            self._inflight = None
+
+    async def _fetch_latest_news(self) -> List[Dict[str, Any]]:
         # 1. Check if news in storage
         cached_data = await self.storage.get(self.collection, self.doc_id)
         
@@ -1,11 +1,14 @@
+import base64
 import uuid
 import datetime
-from typing import Dict, Any, List, Optional
+import orjson
+from typing import Dict, Any, List, Optional, Tuple
 from app.services.storage_service import StorageService
 from app.services.logger_service import LoggerService
 from app.services.config_service import ConfigService
 from app.models.types import RiskProfile, TaxAccountType
-from app.models.plan import Plan, ResearchRun, TaxAccount
+from app.models.plan import Plan, PlanSummary, ResearchRun, TaxAccount
+from app.models.portfolio import AssetHolding
 from app.core.utils import sanitize_numpy
 
 
@@ -28,6 +31,8 @@ class PlanService:
         self.logger = logger
         self.config_service = config_service
         self.collection = "plans"
+        # Research runs kept inline in the plan document; older ones are archived
+        self.max_inline_research_runs = 10
 
     async def create_plan(
         self,
@@ -145,12 +150,10 @@ class PlanService:
         """
         try:
             # Use storage service's list method with user_id filter
-            items = await self.storage.list(
-                self.collection,
-                filters={"user_id": user_id}
-            )
-
-            user_plans = [Plan(**item) for item in items]
+            user_plans = [
+                Plan(**item)
+                async for item in self.storage.stream(self.collection, filters={"user_id": user_id})
+            ]
 
             # Sort by updated_at descending
             user_plans.sort(key=lambda p: p.updated_at, reverse=True)
@@ -160,6 +163,56 @@ class PlanService:
             self.logger.error(f"Error listing plans for user {user_id}: {e}")
             return []
 
+    async def list_plan_summaries(
+        self,
+        user_id: str,
+        limit: int = 50,
+        cursor: Optional[str] = None
+    ) -> Tuple[List[PlanSummary], Optional[str]]:
+        """
+        List one page of plan summaries for a user.
+
+        Args:
+            user_id: User identifier
+            limit: Maximum number of plans to return
+            cursor: `next_cursor` from the previous page, or None for the first page
+
+        Returns:
+            Tuple of (summaries sorted by updated_at descending, cursor for the next page or None)
+
+        Raises:
+            ValueError: If the cursor is malformed
+        """
+        start_after = self._decode_cursor(cursor) if cursor else None
+        # plan_id breaks ties between plans updated at the same time, so none are skipped at a page boundary.
+        # Served by the plans(user_id, updated_at desc, plan_id desc) composite index in firestore.indexes.json
+        items = await self.storage.list_page(
+            self.collection,
+            filters={"user_id": user_id},
+            order_by=["updated_at", "plan_id"],
+            descending=True,
+            limit=limit,
+            start_after=start_after,
+            fields=list(PlanSummary.model_fields)
+        )
+        summaries = [PlanSummary(**item) for item in items]
+        next_cursor = self._encode_cursor(summaries[-1]) if len(summaries) == limit else None
+        return summaries, next_cursor
+
+    @staticmethod
+    def _encode_cursor(summary: PlanSummary) -> str:
+        # Opaque and URL-safe, so it survives unencoded query strings
+        raw = orjson.dumps([summary.updated_at.isoformat(), summary.plan_id])
+        return base64.urlsafe_b64encode(raw).decode()
+
+    @staticmethod
+    def _decode_cursor(cursor: str) -> List[Any]:
+        try:
+            updated_at, plan_id = orjson.loads(base64.urlsafe_b64decode(cursor.encode()))
+            return [datetime.datetime.fromisoformat(updated_at), str(plan_id)]
+        except (ValueError, TypeError) as e:
+            raise ValueError("malformed cursor") from e
+
     async def update_plan(
         self,
         plan_id: str,
@@ -183,30 +236,53 @@ class PlanService:
         Returns:
             True if updated successfully, False otherwise
         """
-        plan = await self.get_plan(plan_id)
-        if not plan:
-            self.logger.warning(f"Plan {plan_id} not found for update")
-            return False
+        updates: Dict[str, Any] = {
+            "name": name,
+            "description": description,
+            "notes": notes,
+            "risk_preference": risk_preference,
+            "initial_portfolio": initial_portfolio
+        }
+        return await self.patch_plan(
+            plan_id,
+            {field: value for field, value in updates.items() if value is not None}
+        )
 
-        # Update fields if provided
-        if name is not None:
-            plan.name = name
-        if description is not None:
-            plan.description = description
-        if notes is not None:
-            plan.notes = notes
-        if risk_preference is not None:
-            plan.risk_preference = risk_preference
-        if initial_portfolio is not None:
-            plan.initial_portfolio = initial_portfolio
+    async def patch_plan(self, plan_id: str, updates: Dict[str, Any]) -> bool:
+        """
+        Apply a partial update to a plan in a single storage write.
 
-        plan.updated_at = datetime.datetime.now(datetime.timezone.utc)
+        Only the given fields (plus updated_at) are written, without
+        reading the plan document first.
 
-        await self.storage.save(
+        Args:
+            plan_id: Plan identifier
+            updates: Plan fields to overwrite
+
+        Returns:
+            True if updated successfully, False if the plan does not exist
+        """
+        fields = dict(updates)
+
+        # Validate typed fields before writing, as they are not round-tripped through Plan
+        if "risk_preference" in fields:
+            fields["risk_preference"] = RiskProfile(fields["risk_preference"])
+        if "initial_portfolio" in fields:
+            fields["initial_portfolio"] = [
+                AssetHolding.model_validate(holding).model_dump()
+                for holding in fields["initial_portfolio"]
+            ]
+
+        fields["updated_at"] = datetime.datetime.now(datetime.timezone.utc)
+
+        updated = await self.storage.update(
             self.collection,
             plan_id,
-            sanitize_numpy(plan.model_dump())
+            sanitize_numpy(fields)
         )
+        if not updated:
+            self.logger.warning(f"Plan {plan_id} not found for update")
+            return False
 
         self.logger.info(f"Updated plan {plan_id}")
         return True
@@ -228,19 +304,18 @@ class PlanService:
         Returns:
             True if attached successfully, False otherwise
         """
-        plan = await self.get_plan(plan_id)
-        if not plan:
-            self.logger.warning(f"Plan {plan_id} not found for optimization result")
-            return False
-
-        plan.optimization_result = optimization_result
-        plan.updated_at = datetime.datetime.now(datetime.timezone.utc)
-
-        await self.storage.save(
+        # Write only the changed fields instead of reading and rewriting the whole plan
+        updated = await self.storage.update(
             self.collection,
             plan_id,
-            sanitize_numpy(plan.model_dump())
+            sanitize_numpy({
+                "optimization_result": optimization_result,
+                "updated_at": datetime.datetime.now(datetime.timezone.utc)
+            })
         )
+        if not updated:
+            self.logger.warning(f"Plan {plan_id} not found for optimization result")
+            return False
 
         self.logger.info(f"Attached optimization result to plan {plan_id}")
         return True
@@ -288,15 +363,58 @@ class PlanService:
         plan.research_history.append(research_run)
         plan.updated_at = datetime.datetime.now(datetime.timezone.utc)
 
-        await self.storage.save(
+        # Keep the plan document small: move the oldest runs out to the archive
+        overflow = plan.research_history[:-self.max_inline_research_runs]
+        if overflow:
+            await self.storage.save_many(
+                self._research_runs_collection(plan_id),
+                {run.run_id: sanitize_numpy(run.model_dump()) for run in overflow}
+            )
+            plan.research_history = plan.research_history[-self.max_inline_research_runs:]
+            plan.archived_research_runs += len(overflow)
+
+        # Write only the research fields, so concurrent edits to the rest of the plan are kept
+        updated = await self.storage.update(
             self.collection,
             plan_id,
-            sanitize_numpy(plan.model_dump())
+            sanitize_numpy(plan.model_dump(
+                include={"research_history", "archived_research_runs", "updated_at"}
+            ))
         )
+        if not updated:
+            self.logger.warning(f"Plan {plan_id} was deleted before research run {run_id} was saved")
+            raise ValueError(f"Plan {plan_id} not found")
 
         self.logger.info(f"Added research run {run_id} to plan {plan_id}")
         return run_id
 
+    async def get_research_history(self, plan_id: str) -> Optional[List[ResearchRun]]:
+        """
+        Get the full research history of a plan, including archived runs.
+
+        Args:
+            plan_id: Plan identifier
+
+        Returns:
+            Research runs sorted by timestamp ascending, or None if the plan does not exist
+        """
+        plan = await self.get_plan(plan_id)
+        if not plan:
+            return None
+
+        history = plan.research_history
+        if plan.archived_research_runs:
+            archived = [
+                ResearchRun(**item)
+                async for item in self.storage.stream(self._research_runs_collection(plan_id))
+            ]
+            archived.sort(key=lambda run: run.timestamp)
+            history = archived + history
+        return history
+
+    def _research_runs_collection(self, plan_id: str) -> str:
+        return f"{self.collection}/{plan_id}/research_runs"
+
     async def delete_plan(self, plan_id: str, user_id: str) -> bool:
         """
         Delete a plan.
@@ -318,6 +436,11 @@ class PlanService:
             return False
 
         await self.storage.delete(self.collection, plan_id)
+        if plan.archived_research_runs:
+            # Subcollections are not deleted with their parent document
+            archive = self._research_runs_collection(plan_id)
+            run_ids = [item["run_id"] async for item in self.storage.stream(archive, fields=["run_id"])]
+            await self.storage.delete_many(archive, run_ids)
 
         self.logger.info(f"Deleted plan {plan_id}")
         return True
@@ -1,6 +1,9 @@
 import asyncio
+import hashlib
+import os
 import uuid
 import datetime
+import orjson
 import numpy as np
 import pandas as pd
 import scipy.optimize as sco
@@ -11,9 +14,13 @@ from app.services.storage_service import StorageService
 from app.services.logger_service import LoggerService
 from app.models.portfolio import OptimizationResult, PortfolioAsset, EfficientFrontierPoint, ScenarioForecast
 from app.models.plan import PortfolioConstraints
-from app.core.utils import sanitize_numpy
+from app.core.cache import StoredResultCache
+from app.core.utils import json_default, sanitize_numpy
 from app.core.prompt_manager import get_prompt_manager
 
+# Bump when a change to the optimizer makes previously cached results invalid
+OPTIMIZATION_CACHE_VERSION = 1
+
 
 class PortfolioOptimizerService:
     def __init__(
@@ -38,6 +45,10 @@ class PortfolioOptimizerService:
         self.macro_service = macro_service
         self.risk_calculator = risk_calculator
         self.collection = "optimization_jobs"
+        # Results of optimizations with the same inputs are reused for OPTIMIZATION_CACHE_TTL_HOURS; 0 disables it
+        self.result_cache = StoredResultCache(
+            storage_service, "optimization_cache", float(os.getenv("OPTIMIZATION_CACHE_TTL_HOURS", "0")), logger
+        )
         self.prompt_manager = get_prompt_manager()
 
     async def start_optimization(
@@ -90,6 +101,21 @@ class PortfolioOptimizerService:
             except Exception as e:
                 self.logger.warning(f"Could not load strategy template {use_strategy_template}: {e}")
 
+        cache_key = self._cache_key(
+            amount, currency, excluded_tickers, constraints, fast,
+            historical_date, use_strategy_template, account_type
+        )
+        if cache_key:
+            cached = await self.result_cache.get(cache_key)
+            if cached:
+                self.logger.info(f"Optimization job {job_id} served from cache {cache_key}")
+                await self.storage_service.save(self.collection, job_id, {
+                    **cached["result"],
+                    "job_id": job_id,
+                    "created_at": datetime.datetime.now(datetime.timezone.utc)
+                })
+                return job_id
+
         initial_job_state = OptimizationResult(
             job_id=job_id,
             status="queued",
@@ -107,11 +133,38 @@ class PortfolioOptimizerService:
         # Fire and forget task
         asyncio.create_task(self._run_optimization(
             job_id, amount, currency, excluded_tickers, constraints, fast,
-            historical_date, use_strategy_template, account_type
+            historical_date, use_strategy_template, account_type, cache_key
         ))
 
         return job_id
 
+    def _cache_key(
+        self,
+        amount: float,
+        currency: str,
+        excluded_tickers: List[str],
+        constraints: Optional[PortfolioConstraints],
+        fast: bool,
+        historical_date: Optional[str],
+        use_strategy_template: Optional[str],
+        account_type: Optional[str]
+    ) -> Optional[str]:
+        """Key for optimizations with these inputs, or None if caching is disabled."""
+        if not self.result_cache.enabled:
+            return None
+        payload = orjson.dumps({
+            "version": OPTIMIZATION_CACHE_VERSION,
+            "amount": amount,
+            "currency": currency,
+            "excluded_tickers": sorted(excluded_tickers),
+            "constraints": constraints.model_dump(mode="json") if constraints else None,
+            "fast": fast,
+            "historical_date": historical_date,
+            "use_strategy_template": use_strategy_template,
+            "account_type": account_type
+        }, default=json_default, option=orjson.OPT_SORT_KEYS)
+        return hashlib.blake2b(payload, digest_size=20).hexdigest()
+
     async def _run_optimization(
         self,
         job_id: str,
@@ -122,7 +175,8 @@ class PortfolioOptimizerService:
         fast: bool = False,
         historical_date: Optional[str] = None,
         use_strategy_template: Optional[str] = None,
-        account_type: Optional[str] = None
+        account_type: Optional[str] = None,
+        cache_key: Optional[str] = None
     ):
         try:
             self.logger.info(f"Starting optimization job {job_id}")
@@ -430,7 +484,10 @@ class PortfolioOptimizerService:
             final_job_state.status = "completed"
             if backtest_result:
                 final_job_state.backtest_result = sanitize_numpy(backtest_result.model_dump())
-            await self.storage_service.save(self.collection, job_id, sanitize_numpy(final_job_state.model_dump()))
+            final_result = sanitize_numpy(final_job_state.model_dump())
+            await self.storage_service.save(self.collection, job_id, final_result)
+            if cache_key:
+                await self.result_cache.save(cache_key, final_result)
 
         except Exception as e:
             self.logger.error(f"Optimization failed for job {job_id}: {e}")
@@ -528,11 +585,8 @@ class PortfolioOptimizerService:
             return None
 
     async def _update_job_status(self, job_id: str, status: str):
-        # Fetch current, update status, save
-        current = await self.storage_service.get(self.collection, job_id)
-        if current:
-            current["status"] = status
-            await self.storage_service.save(self.collection, job_id, current)
+        # Single write, no read; a job that does not exist is left alone
+        await self.storage_service.update(self.collection, job_id, {"status": status})
 
     def _calculate_historical_returns(
         self,
@@ -587,43 +641,43 @@ class PortfolioOptimizerService:
             return constraints_list, bounds_list
 
         # Apply max asset weight constraint
-        if constraints.max_asset_weight is not None:
-            bounds_list = tuple((0.0, constraints.max_asset_weight) for _ in range(num_assets))
-
-        # Handle excluded assets
-        if constraints.excluded_assets:
-            for i, ticker in enumerate(tickers):
-                if ticker in constraints.excluded_assets:
-                    bounds_list = list(bounds_list)
-                    bounds_list[i] = (0.0, 0.0)  # Force 0 weight
-                    bounds_list = tuple(bounds_list)
+        max_weight = constraints.max_asset_weight if constraints.max_asset_weight is not None else 1.0
+        # Handle excluded assets: force 0 weight
+        excluded = set(constraints.excluded_assets)
+        bounds_list = tuple(
+            (0.0, 0.0) if ticker in excluded else (0.0, max_weight)
+            for ticker in tickers
+        )
 
         # Apply sector constraints if we have sector mapping
         if constraints.sector_constraints and self.config_service:
             try:
                 sector_map = self.config_service.get_sector_mapping()
                 if sector_map:
+                    ticker_sectors = np.array([sector_map.get(ticker) for ticker in tickers], dtype=object)
+                    # All sector limits as one linear constraint A @ x + b >= 0:
+                    # max -> max - sum(x[sector]) >= 0, min -> sum(x[sector]) - min >= 0
+                    rows, offsets = [], []
                     for sector, limits in constraints.sector_constraints.items():
-                        # Find tickers in this sector
-                        sector_indices = [
-                            i for i, ticker in enumerate(tickers)
-                            if sector_map.get(ticker) == sector
-                        ]
-
-                        if sector_indices:
-                            # Max constraint for sector
-                            if 'max' in limits:
-                                constraints_list.append({
-                                    'type': 'ineq',
-                                    'fun': lambda x, idx=sector_indices: limits['max'] - np.sum(x[idx])
-                                })
-
-                            # Min constraint for sector
-                            if 'min' in limits:
-                                constraints_list.append({
-                                    'type': 'ineq',
-                                    'fun': lambda x, idx=sector_indices: np.sum(x[idx]) - limits['min']
-                                })
+                        in_sector = (ticker_sectors == sector).astype(float)
+                        if not in_sector.any():
+                            continue
+                        if 'max' in limits:
+                            rows.append(-in_sector)
+                            offsets.append(limits['max'])
+                        if 'min' in limits:
+                            rows.append(in_sector)
+                            offsets.append(-limits['min'])
+
+                    if rows:
+                        A = np.vstack(rows)
+                        b = np.array(offsets, dtype=float)
+                        # Constant Jacobian, so SLSQP does not estimate it by finite differences
+                        constraints_list.append({
+                            'type': 'ineq',
+                            'fun': lambda x: A @ x + b,
+                            'jac': lambda x: A
+                        })
             except Exception as e:
                 self.logger.warning(f"Could not apply sector constraints: {e}")
 
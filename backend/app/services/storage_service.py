@@ -1,5 +1,6 @@
+import asyncio
 from abc import ABC, abstractmethod
-from typing import Dict, Any, Optional, List
+from typing import AsyncIterator, Dict, Any, Optional, List, Union
 
 class StorageService(ABC):
     @abstractmethod
@@ -10,8 +11,27 @@ class StorageService(ABC):
     async def get(self, collection: str, id: str) -> Optional[Dict[str, Any]]:
         pass
         
+    async def get_many(self, collection: str, ids: List[str]) -> Dict[str, Dict[str, Any]]:
+        """
+        Get several documents by id. Returns id -> data for the documents that exist.
+        Backends with batched reads should override this to use a single round-trip.
+        """
+        docs = await asyncio.gather(*(self.get(collection, id) for id in ids))
+        return {id: doc for id, doc in zip(ids, docs) if doc is not None}
+
+    async def create(self, collection: str, id: str, data: Dict[str, Any]) -> bool:
+        """
+        Save a document only if it does not exist yet. Returns False if it already exists.
+        Backends should override this with an atomic create; this fallback is check-then-save.
+        """
+        if await self.get(collection, id) is not None:
+            return False
+        await self.save(collection, id, data)
+        return True
+
     @abstractmethod
-    async def update(self, collection: str, id: str, data: Dict[str, Any]) -> None:
+    async def update(self, collection: str, id: str, data: Dict[str, Any]) -> bool:
+        """Update fields of an existing document. Returns False if it does not exist."""
         pass
 
     @abstractmethod
@@ -19,5 +39,79 @@ class StorageService(ABC):
         pass
 
     @abstractmethod
-    async def list(self, collection: str, filters: Optional[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
+    async def list(
+        self,
+        collection: str,
+        filters: Optional[Dict[str, Any]] = None,
+        fields: Optional[List[str]] = None,
+    ) -> List[Dict[str, Any]]:
+        """List documents matching `filters`. `fields` restricts the returned keys."""
         pass
+
+    async def stream(
+        self,
+        collection: str,
+        filters: Optional[Dict[str, Any]] = None,
+        fields: Optional[List[str]] = None,
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Iterate over the documents of a collection, for callers that do not need them all at once.
+        Backends should override this to fetch documents incrementally instead of listing them all.
+        """
+        for item in await self.list(collection, filters, fields):
+            yield item
+
+    async def count(self, collection: str, filters: Optional[Dict[str, Any]] = None) -> int:
+        """
+        Count documents in a collection.
+        Backends with server-side aggregation should override this to avoid loading documents.
+        """
+        return len(await self.list(collection, filters))
+
+    async def save_many(self, collection: str, docs: Dict[str, Dict[str, Any]]) -> None:
+        """
+        Save several documents (id -> data) to a collection.
+        Backends with bulk support should override this to use a single round-trip.
+        """
+        await asyncio.gather(*(self.save(collection, id, data) for id, data in docs.items()))
+
+    async def delete_many(self, collection: str, ids: List[str]) -> None:
+        """
+        Delete several documents from a collection.
+        Backends with bulk support should override this to use a single round-trip.
+        """
+        await asyncio.gather(*(self.delete(collection, id) for id in ids))
+
+    async def list_page(
+        self,
+        collection: str,
+        filters: Optional[Dict[str, Any]] = None,
+        order_by: Union[str, List[str], None] = None,
+        descending: bool = False,
+        limit: Optional[int] = None,
+        start_after: Any = None,
+        fields: Optional[List[str]] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        List one page of documents ordered by `order_by` (a field, or a list of fields
+        to break ties), resuming after the `start_after` value of that field (or the
+        list of values of those fields). `fields` restricts the returned keys.
+        Backends with native query support should override this to avoid loading
+        the whole collection.
+        """
+        items = await self.list(collection, filters)
+        if order_by:
+            order_fields = [order_by] if isinstance(order_by, str) else order_by
+            sort_key = lambda item: tuple(item[field] for field in order_fields)
+            items.sort(key=sort_key, reverse=descending)
+            if start_after is not None:
+                start = (start_after,) if isinstance(order_by, str) else tuple(start_after)
+                items = [
+                    item for item in items
+                    if (sort_key(item) < start if descending else sort_key(item) > start)
+                ]
+        if limit is not None:
+            items = items[:limit]
+        if fields:
+            items = [{key: item[key] for key in fields if key in item} for item in items]
+        return items
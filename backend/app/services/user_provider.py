@@ -12,3 +12,12 @@ class UserProvider(ABC):
     async def create_user(self, user: UserInDB) -> User:
         """Create a new user."""
         pass
+
+    async def create_user_if_absent(self, user: UserInDB) -> Optional[User]:
+        """
+        Create a new user unless the username is taken, in which case return None.
+        Providers should override this with a single atomic write.
+        """
+        if await self.get_user_by_username(user.username):
+            return None
+        return await self.create_user(user)
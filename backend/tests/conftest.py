@@ -12,16 +12,11 @@ def pytest_sessionstart(session):
 @pytest.fixture(autouse=True)
 def clear_dependency_cache():
     """
-    Clear dependency cache before each test to ensure
-    env var changes (if any) are respected and mocks are fresh.
+    Clear dependency cache before each test so services and mocks are fresh.
+    (Provider-selection env vars are read once, when app.core.dependencies is imported.)
     """
     from app.core import dependencies
-    dependencies.get_history_service.cache_clear()
-    dependencies.get_news_service.cache_clear()
-    dependencies.get_llm_service.cache_clear()
-    dependencies.get_auth_service.cache_clear()
-    dependencies.get_currency_service.cache_clear()
-    dependencies.get_config_service.cache_clear()
+    dependencies._reset_singletons()
 
 @pytest.fixture
 def storage():
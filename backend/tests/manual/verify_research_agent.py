@@ -29,7 +29,10 @@ class MockStorage(StorageService):
 
 # Patch dependencies
 import app.core.dependencies
-app.core.dependencies.get_storage_service = lambda: MockStorage()
+async def get_mock_storage():
+    return MockStorage()
+
+app.core.dependencies.get_storage_service = get_mock_storage
 
 from app.core.dependencies import (
     get_agent_service, get_llm_service, get_config_service,
@@ -43,44 +46,19 @@ logger = logging.getLogger(__name__)
 async def verify_research_agent():
     print("--- Verifying Research Agent Flow ---")
     
-    # Initialize dependencies manually to avoid FastAPI Depends() issues
-    # Need logger first (though it takes no args)
-    # We skip getting logger from dependencies because we have one here, 
-    # but the service getters need the LoggerService object.
-    # We'll rely on the default StdLogger inside the getter if we passed nothing, 
-    # OR we need to pass a logger service.
-    # Actually, the getters use Depends(get_logger). 
-    # Let's instantiate the logger service manually using the provided getter logic.
-    from app.infrastructure.logging.std_logger import StdLogger
-    logger_service = StdLogger()
-    
-    # Storage
-    storage_service = MockStorage()
-
-    print("Initializing services manually...")
-    config_service = get_config_service(storage=storage_service)
-    news_service = get_news_service(config_service=config_service, storage=storage_service, logger=logger_service)
-    history_service = get_history_service(storage=storage_service, logger=logger_service)
-    llm_service = get_llm_service(config=config_service, storage=storage_service)
-    forecasting_engine = get_forecasting_engine(
-        history_service=history_service, 
-        config_service=config_service, 
-        storage_service=storage_service, 
-        logger=logger_service
-    )
-    macro_service = get_macro_service(storage=storage_service, logger=logger_service)
-    risk_calculator = get_risk_calculator()
+    # The getters take no arguments and resolve each other directly,
+    # so they all pick up the patched get_storage_service
+    print("Initializing services...")
+    await get_config_service()
+    await get_news_service()
+    await get_history_service()
+    await get_llm_service()
+    await get_forecasting_engine()
+    await get_macro_service()
+    await get_risk_calculator()
     
     print("Initializing AgentService...")
-    agent_service = get_agent_service(
-        news_service=news_service,
-        history_service=history_service,
-        llm_service=llm_service,
-        forecasting_engine=forecasting_engine,
-        macro_service=macro_service,
-        risk_calculator=risk_calculator,
-        config_service=config_service
-    )
+    agent_service = await get_agent_service()  # resolves its own services through the getters
     
     # Check if research agent is registered
     if "research" not in agent_service._agents:
@@ -0,0 +1,19 @@
+import pytest
+from unittest.mock import patch
+from app.services.auth_service import JWTAuthService
+from app.services.auth.mock_user_provider import MockUserProvider
+
+
+@pytest.mark.asyncio
+async def test_successful_password_checks_are_reused():
+    auth_service = JWTAuthService(MockUserProvider())
+
+    with patch.object(auth_service, "verify_password", wraps=auth_service.verify_password) as verify:
+        assert await auth_service.authenticate_user("demo", "demo123") is not None
+        assert await auth_service.authenticate_user("demo", "demo123") is not None
+        assert verify.call_count == 1
+
+        # Wrong passwords are never cached
+        assert await auth_service.authenticate_user("demo", "wrong") is None
+        assert await auth_service.authenticate_user("demo", "wrong") is None
+        assert verify.call_count == 3
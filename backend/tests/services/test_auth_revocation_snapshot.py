@@ -0,0 +1,84 @@
+import datetime
+import hashlib
+import uuid
+import pytest
+from app.services import auth_service as auth_service_module
+from app.services.auth_service import JWTAuthService
+from app.services.auth.mock_user_provider import MockUserProvider
+
+
+def new_token(auth_service):
+    return auth_service.create_refresh_token({"sub": f"user_{uuid.uuid4().hex[:8]}"})
+
+
+def token_hash(token):
+    return hashlib.sha256(token.encode()).hexdigest()
+
+
+@pytest.fixture
+def snapshot_enabled(monkeypatch):
+    monkeypatch.setattr(auth_service_module, "REVOCATION_SNAPSHOT_TTL_SECONDS", 5)
+
+
+@pytest.mark.asyncio
+async def test_revocations_expire_with_the_token(storage):
+    auth_service = JWTAuthService(MockUserProvider(), storage_service=storage)
+    token = new_token(auth_service)
+    await auth_service.revoke_token(token)
+
+    # Stored as a timestamp, as required by the collection's TTL policy
+    stored = await storage.get(auth_service.revoked_collection, token_hash(token))
+    assert isinstance(stored["expires_at"], datetime.datetime)
+    assert stored["expires_at"].timestamp() == auth_service.verify_token(token, Exception())["exp"]
+
+
+@pytest.mark.asyncio
+async def test_snapshot_loads_other_workers_revocations(storage, snapshot_enabled, monkeypatch):
+    auth_service = JWTAuthService(MockUserProvider(), storage_service=storage)
+    revoked, active = new_token(auth_service), new_token(auth_service)
+    await JWTAuthService(MockUserProvider(), storage_service=storage).revoke_token(revoked)
+    streams = []
+    stream = storage.stream
+    monkeypatch.setattr(storage, "stream", lambda *args, **kwargs: streams.append(args) or stream(*args, **kwargs))
+
+    assert await auth_service.is_token_revoked(revoked)
+    assert not await auth_service.is_token_revoked(active)
+    assert not await auth_service.is_token_revoked(active)
+
+    # Loaded once, then answered from memory
+    assert streams == [(auth_service.revoked_collection,)]
+
+
+@pytest.mark.asyncio
+async def test_snapshot_drops_expired_revocations(storage, snapshot_enabled):
+    auth_service = JWTAuthService(MockUserProvider(), storage_service=storage)
+    now = datetime.datetime.now(datetime.timezone.utc)
+    live, expired = uuid.uuid4().hex, uuid.uuid4().hex
+    await storage.save_many(auth_service.revoked_collection, {
+        live: {"token_hash": live, "expires_at": now + datetime.timedelta(minutes=5)},
+        expired: {"token_hash": expired, "expires_at": now - datetime.timedelta(minutes=5)},
+    })
+
+    assert await auth_service._refresh_revoked_hashes()
+
+    assert live in auth_service._revoked_hashes
+    assert expired not in auth_service._revoked_hashes
+
+
+@pytest.mark.asyncio
+async def test_failed_snapshot_reload_falls_back_to_storage(storage, snapshot_enabled, monkeypatch):
+    auth_service = JWTAuthService(MockUserProvider(), storage_service=storage)
+    revoked = new_token(auth_service)
+    await auth_service.revoke_token(revoked)
+    streams = []
+
+    def unavailable(*args, **kwargs):
+        streams.append(args)
+        raise RuntimeError("unavailable")
+    monkeypatch.setattr(storage, "stream", unavailable)
+
+    assert await auth_service.is_token_revoked(revoked)
+    assert await auth_service.is_token_revoked(revoked)
+
+    # The reload is not retried on every request
+    assert len(streams) == 1
@@ -0,0 +1,56 @@
+import asyncio
+import random
+import pytest
+from app.services.config_service import ConfigService
+from app.services.portfolio_optimizer import PortfolioOptimizerService
+
+
+def optimizer(storage, logger, history_service):
+    service = PortfolioOptimizerService(history_service, ConfigService(storage), storage, logger)
+    runs = []
+
+    # Stand-in for the optimization itself, which is not what these tests are about
+    async def run_optimization(job_id, amount, currency, *args):
+        runs.append(job_id)
+        result = {"job_id": job_id, "status": "completed", "initial_amount": amount, "currency": currency}
+        await storage.save(service.collection, job_id, result)
+        cache_key = args[-1]
+        if cache_key:
+            await service.result_cache.save(cache_key, result)
+
+    service._run_optimization = run_optimization
+    return service, runs
+
+
+@pytest.mark.asyncio
+async def test_repeat_optimization_is_served_from_cache(monkeypatch, storage, logger, history_service):
+    monkeypatch.setenv("OPTIMIZATION_CACHE_TTL_HOURS", "1")
+    service, runs = optimizer(storage, logger, history_service)
+    # Fresh inputs, so entries cached by earlier test runs are not hit
+    amount = random.randint(1, 10**9)
+
+    first = await service.start_optimization(amount, "USD", excluded_tickers=["SPY", "QQQ"], fast=True)
+    await asyncio.sleep(0.1)
+    # Same inputs, tickers in a different order
+    second = await service.start_optimization(amount, "USD", excluded_tickers=["QQQ", "SPY"], fast=True)
+    third = await service.start_optimization(amount + 1, "USD", fast=True)
+    await asyncio.sleep(0.1)
+
+    assert runs == [first, third]
+    cached_job = await storage.get(service.collection, second)
+    assert cached_job["job_id"] == second
+    assert cached_job["status"] == "completed"
+    assert cached_job["initial_amount"] == amount
+
+
+@pytest.mark.asyncio
+async def test_optimization_cache_disabled_by_default(monkeypatch, storage, logger, history_service):
+    monkeypatch.delenv("OPTIMIZATION_CACHE_TTL_HOURS", raising=False)
+    service, runs = optimizer(storage, logger, history_service)
+
+    await service.start_optimization(10000, "USD", fast=True)
+    await asyncio.sleep(0.1)
+    await service.start_optimization(10000, "USD", fast=True)
+    await asyncio.sleep(0.1)
+
+    assert len(runs) == 2
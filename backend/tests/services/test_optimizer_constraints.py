@@ -0,0 +1,26 @@
+import numpy as np
+from unittest.mock import MagicMock
+from app.models.portfolio import PortfolioConstraints
+from app.services.portfolio_optimizer import PortfolioOptimizerService
+
+
+def test_sector_constraints_use_each_sectors_own_limits():
+    config_service = MagicMock()
+    config_service.get_sector_mapping.return_value = {"VTI": "Equity", "QQQ": "Equity", "BND": "Bonds"}
+    service = PortfolioOptimizerService(MagicMock(), config_service, MagicMock(), MagicMock())
+    constraints = PortfolioConstraints(
+        excluded_assets=["GLD"],
+        max_asset_weight=0.5,
+        sector_constraints={"Equity": {"max": 0.6}, "Bonds": {"min": 0.3}}
+    )
+
+    constraints_list, bounds = service._build_optimization_constraints(
+        4, ["VTI", "QQQ", "BND", "GLD"], constraints
+    )
+
+    assert bounds == ((0.0, 0.5), (0.0, 0.5), (0.0, 0.5), (0.0, 0.0))
+    sector = constraints_list[1]
+    x = np.array([0.3, 0.3, 0.4, 0.0])
+    # Equity: 0.6 - 0.6, Bonds: 0.4 - 0.3
+    np.testing.assert_allclose(sector["fun"](x), [0.0, 0.1])
+    np.testing.assert_allclose(sector["jac"](x), [[-1, -1, 0, 0], [0, 0, 1, 0]])
@@ -1,3 +1,4 @@
+import asyncio
 import pytest
 import datetime
 from httpx import AsyncClient, ASGITransport
@@ -99,3 +100,46 @@ async def test_logout_invalid_token(client):
     )
     # Should fail due to auth middleware (401)
     assert resp.status_code == 401
+
+@pytest.mark.asyncio
+async def test_refresh_preserves_role(client, auth_service):
+    # Refresh tokens carry the role, so refreshed access tokens keep it
+    resp = await client.post("/api/auth/token", data={"username": "admin", "password": "admin123"})
+    assert resp.status_code == 200
+    refresh_token = resp.cookies.get("refresh_token")
+    assert auth_service.verify_token(refresh_token, Exception())["role"] == "admin"
+
+    resp_refresh = await client.post("/api/auth/refresh", cookies={"refresh_token": refresh_token})
+    assert resp_refresh.status_code == 200
+    payload = auth_service.verify_token(resp_refresh.json()["access_token"], Exception())
+    assert payload["sub"] == "admin"
+    assert payload["role"] == "admin"
+
+@pytest.mark.asyncio
+async def test_refresh_uses_the_stored_role(client, auth_service):
+    # The role claim in the old refresh token is not trusted
+    stale = auth_service.create_refresh_token({"sub": "demo", "role": "admin"})
+    resp_refresh = await client.post("/api/auth/refresh", cookies={"refresh_token": stale})
+    assert resp_refresh.status_code == 200
+    assert auth_service.verify_token(resp_refresh.json()["access_token"], Exception())["role"] == "user"
+
+    # Users that no longer exist cannot refresh
+    deleted = auth_service.create_refresh_token({"sub": "ghost", "role": "admin"})
+    resp_refresh = await client.post("/api/auth/refresh", cookies={"refresh_token": deleted})
+    assert resp_refresh.status_code == 401
+
+@pytest.mark.asyncio
+async def test_concurrent_revocation_checks(storage, auth_service):
+    revoked, active = (
+        auth_service.create_refresh_token({"sub": f"user_{uuid.uuid4().hex[:8]}"}) for _ in range(2)
+    )
+    # Revoked by another worker
+    await JWTAuthService(MockUserProvider(), storage_service=storage).revoke_token(revoked)
+
+    # Checks arriving together are answered by one multi-get
+    results = await asyncio.gather(
+        auth_service.is_token_revoked(revoked),
+        auth_service.is_token_revoked(active),
+        auth_service.is_token_revoked(revoked)
+    )
+    assert results == [True, False, True]
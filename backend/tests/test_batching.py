@@ -0,0 +1,89 @@
+import asyncio
+import uuid
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+from app.core.batching import AsyncBatcher, BatchWriter
+
+
+@pytest.mark.asyncio
+async def test_batcher_coalesces_concurrent_loads():
+    calls = []
+
+    async def fetch_many(keys):
+        calls.append(sorted(keys))
+        return {key: key * 2 for key in keys}
+
+    batcher = AsyncBatcher(fetch_many, max_wait_ms=5)
+    results = await asyncio.gather(
+        batcher.load_many([1, 2]),
+        batcher.load_many([2, 3]),
+        batcher.load(1),
+    )
+
+    assert results == [{1: 2, 2: 4}, {2: 4, 3: 6}, 2]
+    assert calls == [[1, 2, 3]]
+
+
+@pytest.mark.asyncio
+async def test_batcher_flushes_at_max_batch():
+    calls = []
+
+    async def fetch_many(keys):
+        calls.append(len(keys))
+        return {key: key for key in keys}
+
+    batcher = AsyncBatcher(fetch_many, max_wait_ms=1000, max_batch=2)
+    assert await batcher.load_many([1, 2]) == {1: 1, 2: 2}
+    assert calls == [2]
+
+
+@pytest.mark.asyncio
+async def test_batcher_missing_keys_and_errors():
+    async def fetch_many(keys):
+        return {"ok": 1, "bad": ValueError("bad key")}
+
+    batcher = AsyncBatcher(fetch_many, max_wait_ms=1)
+    ok, missing, bad = await asyncio.gather(
+        batcher.load("ok"), batcher.load("missing"), batcher.load("bad"), return_exceptions=True
+    )
+
+    assert ok == 1
+    assert missing is None
+    assert isinstance(bad, ValueError)
+
+
+@pytest.mark.asyncio
+async def test_batch_writer_groups_writes_until_flush():
+    storage = AsyncMock()
+    writer = BatchWriter(storage, "agent_logs", MagicMock(), max_wait_ms=1000)
+
+    writer.add("a", {"step": 1})
+    writer.add("b", {"step": 2})
+    storage.save_many.assert_not_called()
+
+    await writer.flush()
+    storage.save_many.assert_called_once_with("agent_logs", {"a": {"step": 1}, "b": {"step": 2}})
+
+
+@pytest.mark.asyncio
+async def test_batch_writer_logs_failures():
+    storage = AsyncMock()
+    storage.save_many.side_effect = RuntimeError("unavailable")
+    logger = MagicMock()
+    writer = BatchWriter(storage, "agent_logs", logger, max_batch=1)
+
+    writer.add("a", {"step": 1})
+    await writer.flush()
+
+    logger.error.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_batch_writer_write_waits_for_its_batch(storage, logger):
+    writer = BatchWriter(storage, "test_batch_writer", logger, max_wait_ms=5)
+    ids = [uuid.uuid4().hex, uuid.uuid4().hex]
+
+    await asyncio.gather(writer.write(ids[0], {"n": 1}), writer.write(ids[1], {"n": 2}))
+
+    # Both documents are stored by the time write returns
+    assert await storage.get_many("test_batch_writer", ids) == {ids[0]: {"n": 1}, ids[1]: {"n": 2}}
@@ -1,5 +1,6 @@
 import pytest
 import datetime
+import json
 from httpx import AsyncClient, ASGITransport
 from app.main import app
 from app.core.dependencies import (
@@ -89,6 +90,29 @@ async def test_get_run_status(client, storage):
     assert response.json()["run_id"] == run_id
     assert response.json()["status"] == "completed"
 
+@pytest.mark.asyncio
+async def test_stream_completed_run(client, storage):
+    # A finished run streams its final record and closes the stream
+    run_id = str(uuid.uuid4())
+    await storage.save("agent_runs", run_id, {
+        "run_id": run_id,
+        "agent": "research",
+        "status": "completed",
+        "result": "Test Result"
+    })
+
+    response = await client.get(f"/api/agents/runs/{run_id}/stream")
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/event-stream")
+    events = [line for line in response.text.splitlines() if line.startswith("data: ")]
+    assert len(events) == 1
+    assert json.loads(events[0][len("data: "):])["status"] == "completed"
+
+@pytest.mark.asyncio
+async def test_stream_run_not_found(client):
+    response = await client.get(f"/api/agents/runs/{uuid.uuid4()}/stream")
+    assert response.status_code == 404
+
 @pytest.mark.asyncio
 async def test_get_run_logs(client, storage):
     # Seed logs
@@ -189,6 +213,64 @@ async def test_list_plans(client, storage):
     assert any(p["name"] == "Plan A" for p in plans)
     assert any(p["name"] == "Plan B" for p in plans)
 
+@pytest.mark.asyncio
+async def test_plan_responses_keep_null_fields(client):
+    user_id = f"user_{uuid.uuid4()}"
+    plan_id = (await client.post("/api/plans", json={"name": "Nulls", "user_id": user_id})).json()["plan_id"]
+
+    # Unset optional fields are sent as null, as declared by the Plan response model
+    plan = (await client.get(f"/api/plans/{plan_id}")).json()
+    assert plan["optimization_result"] is None
+    assert plan["notes"] is None
+    plans = (await client.get(f"/api/plans?user_id={user_id}")).json()
+    assert plans[0]["optimization_result"] is None
+    assert plans[0]["notes"] is None
+
+@pytest.mark.asyncio
+async def test_list_plan_summaries_paginates(client):
+    user_id = f"user_{uuid.uuid4()}"
+    for name in ("Plan A", "Plan B", "Plan C"):
+        await client.post("/api/plans", json={"name": name, "user_id": user_id})
+
+    response = await client.get(f"/api/plans/summaries?user_id={user_id}&limit=2")
+    assert response.status_code == 200
+    page = response.json()
+    assert [p["name"] for p in page["items"]] == ["Plan C", "Plan B"]
+    assert "research_history" not in page["items"][0]
+    assert page["next_cursor"]
+
+    response = await client.get(
+        "/api/plans/summaries", params={"user_id": user_id, "limit": 2, "cursor": page["next_cursor"]}
+    )
+    assert response.status_code == 200
+    page = response.json()
+    assert [p["name"] for p in page["items"]] == ["Plan A"]
+    assert page["next_cursor"] is None
+
+@pytest.mark.asyncio
+async def test_list_plan_summaries_pages_through_ties(client, storage):
+    user_id = f"user_{uuid.uuid4()}"
+    updated_at = datetime.datetime.now(datetime.timezone.utc)
+    plan_ids = set()
+    for name in ("Plan A", "Plan B", "Plan C"):
+        plan_id = (await client.post("/api/plans", json={"name": name, "user_id": user_id})).json()["plan_id"]
+        await storage.update("plans", plan_id, {"updated_at": updated_at})
+        plan_ids.add(plan_id)
+
+    seen = []
+    cursor = None
+    while True:
+        params = {"user_id": user_id, "limit": 2, **({"cursor": cursor} if cursor else {})}
+        page = (await client.get("/api/plans/summaries", params=params)).json()
+        seen += [p["plan_id"] for p in page["items"]]
+        cursor = page["next_cursor"]
+        if not cursor:
+            break
+    assert sorted(seen) == sorted(plan_ids)
+
+    response = await client.get(f"/api/plans/summaries?user_id={user_id}&cursor=2024-01-01T00:00:00+00:00")
+    assert response.status_code == 400
+
 @pytest.mark.asyncio
 async def test_update_plan(client):
     # Create first
@@ -206,6 +288,49 @@ async def test_update_plan(client):
     assert resp_get.json()["name"] == "Updated Name"
     assert resp_get.json()["notes"] == "Updated Notes"
 
+@pytest.mark.asyncio
+async def test_get_plan_etag(client):
+    resp = await client.post("/api/plans", json={"name": "ETag Plan"})
+    plan_id = resp.json()["plan_id"]
+
+    resp_get = await client.get(f"/api/plans/{plan_id}")
+    assert resp_get.status_code == 200
+    etag = resp_get.headers["etag"]
+
+    # Unchanged plan is not sent again
+    resp_cached = await client.get(f"/api/plans/{plan_id}", headers={"If-None-Match": etag})
+    assert resp_cached.status_code == 304
+    assert resp_cached.content == b""
+
+    # Updating the plan changes the ETag
+    await client.put(f"/api/plans/{plan_id}", json={"name": "ETag Plan Renamed"})
+    resp_changed = await client.get(f"/api/plans/{plan_id}", headers={"If-None-Match": etag})
+    assert resp_changed.status_code == 200
+    assert resp_changed.headers["etag"] != etag
+    assert resp_changed.json()["name"] == "ETag Plan Renamed"
+
+@pytest.mark.asyncio
+async def test_research_history_archives_old_runs(client, storage, logger):
+    from app.services.plan_service import PlanService
+    resp = await client.post("/api/plans", json={"name": "Research Plan"})
+    plan_id = resp.json()["plan_id"]
+
+    plan_service = PlanService(storage, logger, None)
+    for i in range(12):
+        await plan_service.add_research_run(plan_id, f"query {i}", f"summary {i}")
+
+    plan = (await client.get(f"/api/plans/{plan_id}")).json()
+    assert len(plan["research_history"]) == 10
+    assert plan["archived_research_runs"] == 2
+    assert plan["research_history"][0]["query"] == "query 2"
+
+    response = await client.get(f"/api/plans/{plan_id}/research")
+    assert response.status_code == 200
+    assert [run["query"] for run in response.json()] == [f"query {i}" for i in range(12)]
+
+    response = await client.get(f"/api/plans/{uuid.uuid4()}/research")
+    assert response.status_code == 404
+
 @pytest.mark.asyncio
 async def test_delete_plan(client):
     # Create
@@ -260,6 +385,23 @@ async def test_list_strategies(client):
         assert "risk_level" in strategy
         assert "constraints" in strategy
 
+@pytest.mark.asyncio
+async def test_list_strategies_etag(client):
+    """Test unchanged strategies are revalidated with a 304"""
+    response = await client.get("/api/strategies")
+    assert response.status_code == 200
+    etag = response.headers["etag"]
+    assert "max-age" in response.headers["cache-control"]
+
+    cached = await client.get("/api/strategies", headers={"If-None-Match": etag})
+    assert cached.status_code == 304
+    assert cached.content == b""
+
+    # Filtered lists have their own ETag
+    filtered = await client.get("/api/strategies?risk_level=conservative", headers={"If-None-Match": etag})
+    assert filtered.status_code == 200
+    assert filtered.headers["etag"] != etag
+
 @pytest.mark.asyncio
 async def test_list_strategies_filter_by_risk(client):
     """Test filtering strategies by risk level"""
@@ -861,3 +1003,55 @@ async def test_get_current_user(auth_client):
     data = response.json()
     assert data["username"] == username
     assert data["role"] == "user"
+
+
+# ==================== Admin Tests ====================
+
+@pytest.fixture
+async def admin_client(storage):
+    """Client authenticated as an admin user"""
+    from app.core.dependencies import get_current_admin_user
+    from app.models.auth import User
+    app.dependency_overrides[get_current_admin_user] = lambda: User(username="test-admin", role="admin")
+    app.dependency_overrides[get_storage_service] = lambda: storage
+
+    try:
+        async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as ac:
+            yield ac
+    except Exception as e:
+        raise
+
+    app.dependency_overrides.clear()
+
+
+@pytest.mark.asyncio
+async def test_get_cache_stats(admin_client, storage):
+    """Test cache stats report a count for every cached collection"""
+    run_id = str(uuid.uuid4())
+    await storage.save("agent_runs", run_id, {"run_id": run_id, "status": "completed"})
+
+    response = await admin_client.get("/api/admin/cache/stats")
+    assert response.status_code == 200
+    stats = response.json()
+
+    for collection in ["news_cache", "historical_data", "optimization_jobs", "agent_runs", "plans"]:
+        assert collection in stats
+        assert "error" not in stats[collection]
+    assert stats["agent_runs"]["count"] >= 1
+
+
+@pytest.mark.asyncio
+async def test_clear_cache(admin_client, storage):
+    """Test clearing a cache collection deletes every identifiable item"""
+    job_ids = [str(uuid.uuid4()) for _ in range(3)]
+    for job_id in job_ids:
+        await storage.save("optimization_jobs", job_id, {"job_id": job_id, "status": "completed"})
+
+    response = await admin_client.delete("/api/admin/cache/optimization_jobs")
+    assert response.status_code == 200
+    data = response.json()
+    assert data["status"] == "cleared"
+    assert data["items_deleted"] >= 3
+
+    for job_id in job_ids:
+        assert await storage.get("optimization_jobs", job_id) is None
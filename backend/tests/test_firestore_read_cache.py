@@ -0,0 +1,62 @@
+import pytest
+import uuid
+from app.infrastructure.storage import firestore_storage
+from app.infrastructure.storage.firestore_storage import FirestoreStorage
+
+COLLECTION = "test_read_cache"
+
+
+@pytest.fixture(autouse=True)
+def read_cache_enabled(monkeypatch):
+    monkeypatch.setattr(firestore_storage, "READ_CACHE_TTL_SECONDS", 5)
+
+
+@pytest.mark.asyncio
+async def test_writes_invalidate_cached_reads(storage):
+    doc_id = uuid.uuid4().hex
+    await storage.save(COLLECTION, doc_id, {"value": 1})
+    assert await storage.get(COLLECTION, doc_id) == {"value": 1}
+    assert await storage.list(COLLECTION, {"value": 1}) == [{"value": 1}]
+
+    await storage.update(COLLECTION, doc_id, {"value": 2})
+    assert await storage.get(COLLECTION, doc_id) == {"value": 2}
+    assert await storage.list(COLLECTION, {"value": 1}) == []
+
+    # The cache is shared by all instances in the process
+    await FirestoreStorage().update(COLLECTION, doc_id, {"value": 3})
+    assert await storage.get(COLLECTION, doc_id) == {"value": 3}
+
+
+@pytest.mark.asyncio
+async def test_cached_values_are_copies(storage):
+    doc_id = uuid.uuid4().hex
+    await storage.save(COLLECTION, doc_id, {"tags": ["a"]})
+
+    first = await storage.get(COLLECTION, doc_id)
+    first["tags"].append("b")
+
+    assert await storage.get(COLLECTION, doc_id) == {"tags": ["a"]}
+
+
+@pytest.mark.asyncio
+async def test_missing_documents_are_not_cached(storage):
+    doc_id = uuid.uuid4().hex
+    assert await storage.get(COLLECTION, doc_id) is None
+
+    # Written by another worker: this process is not told about it
+    await storage.db.collection(COLLECTION).document(doc_id).set({"value": 1})
+
+    assert await storage.get(COLLECTION, doc_id) == {"value": 1}
+
+
+@pytest.mark.asyncio
+async def test_reads_are_not_cached_when_disabled(storage, monkeypatch):
+    monkeypatch.setattr(firestore_storage, "READ_CACHE_TTL_SECONDS", 0)
+    doc_id = uuid.uuid4().hex
+    await storage.save(COLLECTION, doc_id, {"value": 1})
+    assert await storage.get(COLLECTION, doc_id) == {"value": 1}
+
+    # Written by another worker
+    await storage.db.collection(COLLECTION).document(doc_id).set({"value": 2})
+
+    assert await storage.get(COLLECTION, doc_id) == {"value": 2}
@@ -0,0 +1,43 @@
+import uuid
+import pytest
+from app.core.langgraph_base import LangGraphAgent
+
+
+class CountingAgent(LangGraphAgent):
+    def __init__(self, logger, storage):
+        super().__init__(logger, storage)
+        self.graph_runs = 0
+
+    async def _run_graph(self, run_id, input_data):
+        self.graph_runs += 1
+        return {"answer": input_data["query"].upper()}
+
+
+@pytest.mark.asyncio
+async def test_run_reuses_cached_result_for_same_input(monkeypatch, storage, logger):
+    monkeypatch.setenv("AGENT_RUN_CACHE_TTL_HOURS", "1")
+    agent = CountingAgent(logger, storage)
+    # Fresh queries, so entries cached by earlier test runs are not hit
+    query, other_query = f"spy-{uuid.uuid4().hex}", f"qqq-{uuid.uuid4().hex}"
+
+    first = await agent.run("run-1", {"query": query, "depth": 1})
+    # Same input with a different key order hits the cache
+    second = await agent.run("run-2", {"depth": 1, "query": query})
+    third = await agent.run("run-3", {"query": other_query, "depth": 1})
+    await agent.flush_logs()
+
+    assert first == second == {"answer": query.upper()}
+    assert third == {"answer": other_query.upper()}
+    assert agent.graph_runs == 2
+
+
+@pytest.mark.asyncio
+async def test_run_cache_disabled_by_default(monkeypatch, storage, logger):
+    monkeypatch.delenv("AGENT_RUN_CACHE_TTL_HOURS", raising=False)
+    agent = CountingAgent(logger, storage)
+
+    await agent.run("run-1", {"query": "spy"})
+    await agent.run("run-2", {"query": "spy"})
+    await agent.flush_logs()
+
+    assert agent.graph_runs == 2
@@ -1,3 +1,4 @@
+import asyncio
 import pytest
 import datetime
 from unittest.mock import AsyncMock, MagicMock
@@ -66,3 +67,23 @@ async def test_news_service_cache_miss_none():
     assert news[0]["title"] == "Fresh News"
     mock_provider.get_news_summary.assert_called_once()
     mock_storage.save.assert_called_once()
+
+@pytest.mark.asyncio
+async def test_news_service_concurrent_calls_share_fetch():
+    mock_provider = AsyncMock()
+    mock_storage = AsyncMock()
+    mock_logger = MagicMock()
+
+    mock_storage.get.return_value = None
+
+    async def slow_news():
+        await asyncio.sleep(0.01)
+        return [{"title": "Shared News"}]
+    mock_provider.get_news_summary.side_effect = slow_news
+
+    service = NewsService(provider=mock_provider, storage=mock_storage, logger=mock_logger, ttl_hours=12)
+    results = await asyncio.gather(*(service.get_latest_news() for _ in range(5)))
+
+    assert all(news == [{"title": "Shared News"}] for news in results)
+    mock_provider.get_news_summary.assert_called_once()
+    mock_storage.get.assert_called_once()
@@ -196,7 +196,7 @@ export default function PlanManager({ onPlanSelect, currentPlanId }: PlanManager
                                                     <span className="badge badge-success">Optimized</span>
                                                 )}
                                                 {plan.research_history.length > 0 && (
-                                                    <span className="badge badge-info">{plan.research_history.length} Research</span>
+                                                    <span className="badge badge-info">{plan.research_history.length + (plan.archived_research_runs ?? 0)} Research</span>
                                                 )}
                                             </div>
                                         </div>
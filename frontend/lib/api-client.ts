@@ -389,6 +389,7 @@ export interface Plan {
     recurring_investment?: RecurringInvestment | null;
     tax_accounts?: TaxAccount[] | null;
     research_history: ResearchRun[];
+    archived_research_runs?: number;
     notes?: string | null;
 }
 